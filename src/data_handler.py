@@ -4,15 +4,41 @@
 # Libraries
 # ----------------------------------------------------------------------
 import logging
+import numpy as np
 import pandas as pd
 from pathlib import Path
+import bisect
 import csv
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import operator
 import os
+import re
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from tqdm import tqdm
 from tabulate import tabulate
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; the "pyarrow" engine falls back to "c"
+    pa = None
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+# Reader engines shared by ``load_data`` and ``convert_file``.
+#   c       - pandas' C parser (default)
+#   pyarrow - multithreaded Arrow CSV reader, returns Arrow-backed dtypes
+#   python  - pandas' pure Python parser, slow but handles regex separators
+READER_ENGINES = ("c", "pyarrow", "python")
+
 
 # ----------------------------------------------------------------------
 def save_filepath(path):
@@ -83,17 +109,273 @@ def convert_txt_to_csv(txt_path: str) -> Path:
     Path
         Location of the written CSV file.
     """
-    df = pd.read_csv(txt_path, sep=r"\s+", engine="python")
+    df = _read_text(txt_path, r"\s+")
     logger.info("Read TXT file %s with shape %s", txt_path, df.shape)
     print(f"[Data Handler] Loaded TXT file -> {txt_path}")
     return convert_to_csv(df, txt_path)
 
 
+def _resolve_engine(engine: str, sep: str) -> str:
+    """Return the reader engine that can actually handle ``sep``.
+
+    Whitespace separators (``\\s+``) are understood natively by the C parser,
+    so only other multi-character or regex separators need the Python
+    engine.  The Arrow reader only supports single character delimiters and
+    is skipped when ``pyarrow`` is not installed.
+    """
+    if engine not in READER_ENGINES:
+        raise ValueError(f"engine must be one of {', '.join(READER_ENGINES)}")
+
+    if engine == "pyarrow" and (pa_csv is None or len(sep) != 1):
+        logger.info("pyarrow engine unavailable for sep=%r, using c engine", sep)
+        print(f"[Data Handler] pyarrow engine unavailable for sep={sep!r}, using c")
+        engine = "c"
+    if engine == "c" and len(sep) != 1 and sep != r"\s+":
+        engine = "python"
+    return engine
+
+
+def _iter_text_chunks(
+    handle, sep: str, encoding: str, engine: str, chunksize=10000, usecols=None
+):
+    """Yield DataFrames parsed from an open binary ``handle``.
+
+    The ``pyarrow`` engine yields one frame per Arrow record batch (sized by
+    bytes rather than ``chunksize``) with ``pd.ArrowDtype`` columns.  Only
+    the columns listed in ``usecols`` are parsed when it is given.
+
+    Arrow's streaming reader fixes column types from the first block, so a
+    column that is blank or numeric for the first megabyte and text later
+    fails to convert.  The file is therefore parsed in one go, which infers
+    types over all of it, and each batch is released once it is yielded.
+    """
+    engine = _resolve_engine(engine, sep)
+    if engine == "pyarrow":
+        table = pa_csv.read_csv(
+            handle,
+            read_options=pa_csv.ReadOptions(use_threads=True, encoding=encoding),
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+            convert_options=pa_csv.ConvertOptions(include_columns=usecols),
+        )
+        batches = table.to_batches()
+        del table
+        for i in range(len(batches)):
+            batch, batches[i] = batches[i], None
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+        return
+
+    yield from pd.read_csv(
+        handle,
+        sep=sep,
+        chunksize=chunksize,
+        encoding=encoding,
+        engine=engine,
+        usecols=usecols,
+    )
+
+
+def _read_text(path: str, sep: str, encoding: str = "utf-8", engine: str = "c"):
+    """Read an entire delimited text file with the selected engine."""
+    engine = _resolve_engine(engine, sep)
+    if engine == "pyarrow":
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(use_threads=True, encoding=encoding),
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return pd.read_csv(path, sep=sep, encoding=encoding, engine=engine)
+
+
+# Comparison operators accepted in load-time row filters.  The tuple format
+# ``(column, op, value)`` matches pyarrow's dataset filters so the same list
+# can be handed straight to ``pd.read_parquet``.
+FILTER_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+
+_FILTER_RE = re.compile(r"^\s*(.+?)\s+(==|!=|<=|>=|<|>|not in|in)\s+(.+?)\s*$")
+
+
+def _parse_filter_value(text: str):
+    """Convert a filter literal to ``int``/``float`` when it looks numeric.
+
+    Quoted literals such as ``'02134'`` always stay strings.
+    """
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_filters(text: str) -> list[tuple]:
+    """Parse ``"col op value; col op value"`` into row filter tuples.
+
+    Clauses separated by ``;`` are combined with AND.  ``in`` and ``not in``
+    take a comma separated list of values.
+
+    Examples
+    --------
+    >>> parse_filters("status == OK; amount >= 100; zip == '02134'")
+    [('status', '==', 'OK'), ('amount', '>=', 100), ('zip', '==', '02134')]
+    """
+    filters = []
+    for clause in text.split(";"):
+        if not clause.strip():
+            continue
+        match = _FILTER_RE.match(clause)
+        if not match:
+            raise ValueError(f"Invalid filter clause: {clause.strip()!r}")
+        col, op, value = match.groups()
+        if op in {"in", "not in"}:
+            value = [_parse_filter_value(v) for v in value.split(",")]
+        else:
+            value = _parse_filter_value(value)
+        filters.append((col, op, value))
+    return filters
+
+
+def _filter_columns(filters) -> list[str]:
+    """Return the column names referenced by ``filters``."""
+    groups = filters if filters and isinstance(filters[0], list) else [filters]
+    return [col for group in groups for col, _, _ in group]
+
+
+def _apply_filters(df: pd.DataFrame, filters) -> pd.DataFrame:
+    """Keep rows of ``df`` matching pyarrow-style ``filters``.
+
+    ``filters`` is either a list of ``(column, op, value)`` tuples combined
+    with AND, or a list of such lists combined with OR.
+    """
+    groups = filters if isinstance(filters[0], list) else [filters]
+    mask = pd.Series(False, index=df.index)
+    for group in groups:
+        group_mask = pd.Series(True, index=df.index)
+        for col, op, value in group:
+            group_mask &= FILTER_OPS[op](df[col], value).fillna(False).astype(bool)
+        mask |= group_mask
+    return df[mask]
+
+
+class _ChunkAccumulator:
+    """Collect DataFrame chunks while enforcing an optional memory ceiling.
+
+    By default chunks are kept in a list and joined with ``pd.concat`` which
+    briefly holds every chunk and the combined frame at the same time.  With
+    ``bounded=True`` each chunk is converted to an Arrow table as it arrives
+    so the pandas chunk can be released immediately.  ``finish`` then joins
+    the tables without copying and converts them with ``self_destruct`` so
+    Arrow buffers are freed column by column, keeping peak memory close to
+    the size of the final DataFrame.
+    """
+
+    def __init__(self, bounded: bool = False, max_memory_mb: float | None = None):
+        if bounded and pa is None:
+            logger.warning("pyarrow not installed; bounded loading disabled")
+            print("[Data Handler] pyarrow not installed; bounded loading disabled")
+            bounded = False
+        self.bounded = bounded
+        self.max_bytes = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+        self.nbytes = 0
+        self.rows = 0
+        self._parts = []
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if self.bounded:
+            part = pa.Table.from_pandas(chunk, preserve_index=False)
+            size = part.nbytes
+        else:
+            part = chunk
+            size = int(chunk.memory_usage(deep=True).sum()) if self.max_bytes else 0
+
+        self.nbytes += size
+        self.rows += len(chunk)
+        if self.max_bytes and self.nbytes > self.max_bytes:
+            raise MemoryError(
+                f"Loaded data exceeds the {self.max_bytes / (1024 * 1024):.0f} MB "
+                f"memory limit after {self.rows} rows"
+            )
+        self._parts.append(part)
+
+    def finish(self) -> pd.DataFrame:
+        parts, self._parts = self._parts, []
+        if not self.bounded:
+            return pd.concat(parts, ignore_index=True)
+
+        try:
+            parts = _unify_columns(parts)
+            table = pa.concat_tables(parts, promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Chunks with incompatible inferred types: let pandas upcast them,
+            # releasing each Arrow part as soon as it is converted.
+            logger.warning("Falling back to pd.concat: %s", e)
+            frames = []
+            for i in range(len(parts)):
+                frames.append(parts[i].to_pandas())
+                parts[i] = None
+            return pd.concat(frames, ignore_index=True)
+        del parts
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _unify_columns(parts: list) -> list:
+    """Give each column one type across all chunk tables.
+
+    A column that is blank throughout one chunk is inferred as ``double`` (or
+    ``null``) there; its values carry no type, so it takes the type the
+    column has in the chunks holding data.  Types Arrow can promote (such as
+    ``int64`` and ``double``) are left to ``concat_tables``; a column whose
+    chunks disagree otherwise, e.g. ``int64`` in one and text in the next,
+    becomes ``large_string`` everywhere.
+    """
+    types = {}
+    for part in parts:
+        for i, column in enumerate(part.columns):
+            if column.null_count < len(column):
+                types.setdefault(i, []).append(column.type)
+    targets = {}
+    for i, seen in types.items():
+        try:
+            schema = pa.unify_schemas(
+                [pa.schema([("c", t)]) for t in seen], promote_options="permissive"
+            )
+            targets[i] = schema.field(0).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            targets[i] = pa.large_string()
+    unified = []
+    for part in parts:
+        for i, column in enumerate(part.columns):
+            wanted = targets.get(i)
+            if wanted is None or column.type == wanted:
+                continue
+            field = part.schema.field(i).with_type(wanted)
+            if column.null_count == len(column):
+                part = part.set_column(i, field, pa.nulls(len(column), wanted))
+            elif pa.types.is_large_string(wanted):
+                part = part.set_column(i, field, column.cast(wanted))
+        unified.append(part)
+    return unified
+
+
 def convert_file(
     input_path: str,
     output_dir: str,
     target_format: str = "csv",
     progress_fn=None,
+    engine: str = "c",
+    xlsx_split: str = "sheets",
 ) -> Path:
     """Convert an input file to CSV or Excel.
 
@@ -107,11 +389,16 @@ def convert_file(
         Either ``"csv"`` or ``"xlsx"``. Defaults to ``"csv"``.
     progress_fn : callable, optional
         Callback receiving ``(percent, message)`` for UI updates.
+    engine : str, optional
+        Reader engine for CSV, TSV and TXT input. One of ``READER_ENGINES``.
+    xlsx_split : str, optional
+        For xlsx output beyond Excel's row limit, continue on extra
+        ``"sheets"`` or in extra ``"files"`` (see ``export_dataframe``).
 
     Returns
     -------
     Path
-        Location of the newly created file.
+        Location of the newly created file (the first one when split).
     """
 
     suffix = Path(input_path).suffix.lower()
@@ -120,7 +407,7 @@ def convert_file(
         progress_fn(0, "Reading input")
 
     if suffix == ".csv":
-        df = pd.read_csv(input_path)
+        df = _read_text(input_path, ",", engine=engine)
     elif suffix in {".xls", ".xlsx"}:
         df = pd.read_excel(input_path)
     elif suffix == ".json":
@@ -128,9 +415,9 @@ def convert_file(
     elif suffix in {".parquet", ".pq"}:
         df = pd.read_parquet(input_path)
     elif suffix == ".tsv":
-        df = pd.read_csv(input_path, sep="\t")
+        df = _read_text(input_path, "\t", engine=engine)
     elif suffix == ".txt":
-        df = pd.read_csv(input_path, sep=r"\s+", engine="python")
+        df = _read_text(input_path, r"\s+", engine=engine)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
@@ -144,7 +431,19 @@ def convert_file(
     if target_format == "csv":
         df.to_csv(output_path, index=False)
     elif target_format == "xlsx":
-        df.to_excel(output_path, index=False)
+
+        def write_progress(p, m):
+            if progress_fn:
+                progress_fn(50 + p / 2, m)
+
+        _write_xlsx(
+            _export_blocks(df, None, 100_000),
+            output_path,
+            df.columns,
+            len(df),
+            write_progress,
+            xlsx_split,
+        )
     else:
         raise ValueError("target_format must be 'csv' or 'xlsx'")
 
@@ -158,11 +457,185 @@ def convert_file(
     return output_path
 
 
+def compact_dataframe(
+    df: pd.DataFrame, sample_size: int = 10000, category_ratio: float = 0.5
+) -> pd.DataFrame:
+    """Shrink a DataFrame's memory footprint by choosing tighter dtypes.
+
+    Integers are downcast to the smallest type holding their range, floats
+    are downcast to ``float32`` only when no precision is lost, and text
+    columns are sampled to detect ISO formatted dates or low-cardinality
+    values that are stored more cheaply as ``category``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to compact. Columns are replaced in place.
+    sample_size : int, optional
+        Number of non-null values inspected per text column.
+    category_ratio : float, optional
+        Text columns whose sampled unique/total ratio is at or below this
+        value are converted to ``category``.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same frame, with ``attrs["memory_before"]`` and
+        ``attrs["memory_after"]`` recording the footprint in bytes.
+    """
+    before = int(df.memory_usage(deep=True).sum())
+
+    for col in df.columns:
+        ser = df[col]
+        if isinstance(ser.dtype, (pd.ArrowDtype, pd.CategoricalDtype)):
+            continue
+        if pd.api.types.is_bool_dtype(ser):
+            continue
+
+        if pd.api.types.is_integer_dtype(ser):
+            df[col] = pd.to_numeric(ser, downcast="integer")
+        elif pd.api.types.is_float_dtype(ser):
+            narrow = ser.astype("float32")
+            if ((narrow == ser) | ser.isna()).all():
+                df[col] = narrow
+        elif pd.api.types.is_object_dtype(ser) or pd.api.types.is_string_dtype(ser):
+            sample = ser.dropna().head(sample_size)
+            if sample.empty:
+                continue
+            # Bare digit strings (IDs, years, codes) are valid ISO 8601 but
+            # should not be treated as dates.
+            looks_numeric = sample.astype(str).str.fullmatch(r"\d+").any()
+            dates = pd.to_datetime(sample, errors="coerce", format="ISO8601")
+            if not looks_numeric and dates.notna().all():
+                parsed = pd.to_datetime(ser, errors="coerce", format="ISO8601")
+                if parsed.isna().sum() == ser.isna().sum():
+                    df[col] = parsed
+                    continue
+            if sample.nunique() / len(sample) <= category_ratio:
+                df[col] = ser.astype("category")
+
+    after = int(df.memory_usage(deep=True).sum())
+    df.attrs["memory_before"] = before
+    df.attrs["memory_after"] = after
+    logger.info("Compacted DataFrame: %s -> %s bytes", before, after)
+    print(
+        f"[Data Handler] Compacted memory {before / (1024 * 1024):.2f} MB -> "
+        f"{after / (1024 * 1024):.2f} MB"
+    )
+    return df
+
+
+# ----------------------------------------------------------------------
+# Dataset snapshots
+# ----------------------------------------------------------------------
+# ``load_data`` keeps a columnar copy of each loaded dataset in the
+# environment's ``stages`` folder and its profile (source fingerprint, load
+# options and column statistics) in ``process``.  Reopening an unchanged
+# file with the same options reads the snapshot instead of parsing it again.
+SNAPSHOT_VERSION = 1
+
+
+def _snapshot_paths(env: dict, file_path) -> tuple[Path, Path]:
+    stem = Path(file_path).stem
+    return env["stages"] / f"{stem}.parquet", env["process"] / f"{stem}_profile.json"
+
+
+def _load_snapshot(env: dict, file_path, options, progress_fn=None):
+    """Return the stored snapshot of ``file_path`` if it is still current."""
+    if pa is None:
+        return None
+    snapshot_path, profile_path = _snapshot_paths(env, file_path)
+    try:
+        profile = json.loads(profile_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        profile.get("version") != SNAPSHOT_VERSION
+        or profile.get("options") != repr(options)
+        or profile.get("source") != _source_fingerprint(file_path)
+        or not snapshot_path.exists()
+    ):
+        logger.info("Snapshot of %s is missing or stale", file_path)
+        return None
+
+    if progress_fn:
+        progress_fn(10, "Reading snapshot")
+    try:
+        df = pd.read_parquet(snapshot_path)
+    except Exception as e:
+        logger.warning("Could not read snapshot %s: %s", snapshot_path, e)
+        return None
+    df.attrs.update(profile.get("attrs", {}))
+    logger.info("Loaded snapshot %s", snapshot_path)
+    print(f"[Data Handler] Loaded snapshot -> {snapshot_path}")
+    return df, profile
+
+
+def _save_snapshot(env: dict, df: pd.DataFrame, file_path, options) -> dict | None:
+    """Write ``df`` to ``stages`` and its profile to ``process``.
+
+    The profile is written last, so a profile on disk always refers to a
+    complete snapshot.  Failures (e.g. object columns Arrow cannot encode)
+    are logged and leave no snapshot behind.
+    """
+    if pa is None:
+        return None
+    snapshot_path, profile_path = _snapshot_paths(env, file_path)
+    nulls = df.isnull().sum()
+    profile = {
+        "version": SNAPSHOT_VERSION,
+        "source": _source_fingerprint(file_path),
+        "options": repr(options),
+        "rows": len(df),
+        "columns": [
+            {"name": str(c), "dtype": str(t), "nulls": int(n)}
+            for c, t, n in zip(df.columns, df.dtypes, nulls)
+        ],
+        "attrs": {
+            k: df.attrs[k] for k in ("memory_before", "memory_after") if k in df.attrs
+        },
+    }
+    tmp_snapshot = snapshot_path.with_suffix(".tmp")
+    tmp_profile = profile_path.with_suffix(".tmp")
+    try:
+        profile_path.unlink(missing_ok=True)
+        df.to_parquet(tmp_snapshot)
+        os.replace(tmp_snapshot, snapshot_path)
+        tmp_profile.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        os.replace(tmp_profile, profile_path)
+    except Exception as e:
+        logger.warning("Could not write snapshot of %s: %s", file_path, e)
+        print(f"[Data Handler] Snapshot skipped: {e}")
+        tmp_snapshot.unlink(missing_ok=True)
+        return None
+    logger.info("Snapshot written -> %s", snapshot_path)
+    print(f"[Data Handler] Snapshot saved -> {snapshot_path}")
+    return profile
+
+
+def _seed_profile(df: pd.DataFrame, profile: dict | None) -> None:
+    """Prime the analysis profile cache with the stored null counts."""
+    cache = _profile_for(df) if profile else None
+    if cache is None:
+        return
+    nulls = [c["nulls"] for c in profile["columns"]]
+    if len(nulls) == len(df.columns):
+        cache.values["missing"] = dict(zip(df.columns, nulls))
+
+
 def load_data(
     file_path: str,
     progress_fn=None,
     encoding: str = "utf-8",
     delimiter: str | None = None,
+    single_pass: bool = True,
+    engine: str = "c",
+    bounded_memory: bool = False,
+    max_memory_mb: float | None = None,
+    compact: bool = False,
+    usecols: list[str] | None = None,
+    filters: list | None = None,
+    dataset_name: str | None = None,
 ):
     """Load a dataset with optional encoding and delimiter control.
 
@@ -177,6 +650,38 @@ def load_data(
     delimiter : str | None, optional
         Specific delimiter to use when reading CSV or TXT. When ``None`` the
         function attempts auto-detection for text formats.
+    single_pass : bool, optional
+        When ``True`` (the default) text files are read once and progress is
+        derived from the byte offset of the underlying file handle.  When
+        ``False`` the file is scanned up front to count lines so progress can
+        be reported in rows.
+    engine : str, optional
+        Reader engine for text formats, one of ``READER_ENGINES``.
+        ``"pyarrow"`` parses on all cores and returns Arrow-backed dtypes;
+        ``"python"`` is a slower streaming fallback for unusual separators.
+    bounded_memory : bool, optional
+        Accumulate text chunks as Arrow tables instead of a list of frames
+        joined by ``pd.concat``. Peak memory then stays near the size of the
+        final DataFrame rather than roughly double it. Requires ``pyarrow``.
+    max_memory_mb : float | None, optional
+        Abort loading text formats with a ``MemoryError`` as soon as the
+        accumulated data grows beyond this many megabytes.
+    compact : bool, optional
+        Run ``compact_dataframe`` on the result to downcast numerics, encode
+        low-cardinality text as ``category`` and parse ISO dates.
+    usecols : list[str] | None, optional
+        Only load these columns. Pushed into the CSV and Excel readers and
+        into the Parquet column selection.
+    filters : list | None, optional
+        Row filters as ``(column, op, value)`` tuples (see ``parse_filters``).
+        Parquet files hand them to pyarrow's dataset filtering; text files
+        apply them to every chunk before it is kept.
+    dataset_name : str | None, optional
+        Name of the dataset environment (see ``create_dataset_environment``).
+        When given, the loaded frame is saved as a Parquet snapshot in
+        ``stages`` with its profile in ``process``, and later loads of the
+        unchanged file with the same options read the snapshot instead of
+        parsing the source.  Requires ``pyarrow``.
 
     Returns
     -------
@@ -187,25 +692,43 @@ def load_data(
     -----
     ``pandas`` does not provide native progress callbacks.  For text based
     formats we therefore read the file in chunks and approximate progress
-    based on the number of rows processed.  This approach keeps the UI
-    responsive while large files are being loaded.
+    based on how much of the file has been consumed.  This approach keeps
+    the UI responsive while large files are being loaded.
     """
     try:
         if progress_fn:
             progress_fn(0, "Starting load")
 
         suffix = Path(file_path).suffix.lower()
-
-        if suffix in {".csv", ".tsv", ".txt"}:
+        options = (encoding, delimiter, engine, compact, usecols, filters)
+        env = create_dataset_environment(dataset_name) if dataset_name else None
+        snapshot = _load_snapshot(env, file_path, options, progress_fn) if env else None
+        profile = snapshot[1] if snapshot else None
+
+        # Columns needed to evaluate the filters must be read even when they
+        # are not part of the requested projection.
+        read_cols = None
+        if usecols:
+            read_cols = list(usecols)
+            if filters:
+                read_cols += [c for c in _filter_columns(filters) if c not in read_cols]
+
+        if snapshot:
+            df = snapshot[0]
+        elif suffix in {".csv", ".tsv", ".txt"}:
             # ------------------------------------------------------------------
             # For line-based text files we stream the data in chunks so that
-            # the progress bar can be updated incrementally.  We first count the
-            # lines to determine the total number of rows.  Progress is then
-            # calculated from the proportion of processed rows.
+            # the progress bar can be updated incrementally.  By default the
+            # file is opened in binary mode and handed to pandas directly; the
+            # handle's byte offset then tells us how far through the file the
+            # reader is without a separate pass to count lines.
             # ------------------------------------------------------------------
-            total_rows = sum(1 for _ in open(file_path, "r", encoding=encoding))
-            logger.info("Total rows detected: %s", total_rows)
-            print(f"[Data Handler] Total rows detected: {total_rows}")
+            total_bytes = os.path.getsize(file_path)
+            total_rows = 0
+            if not single_pass:
+                total_rows = sum(1 for _ in open(file_path, "r", encoding=encoding))
+                logger.info("Total rows detected: %s", total_rows)
+                print(f"[Data Handler] Total rows detected: {total_rows}")
 
             if delimiter is None:
                 with open(file_path, "r", encoding=encoding) as f:
@@ -217,31 +740,39 @@ def load_data(
                     sep = "," if suffix == ".csv" else "\t" if suffix == ".tsv" else r"\s+"
             else:
                 sep = delimiter
-            reader = pd.read_csv(
-                file_path,
-                sep=sep,
-                chunksize=10000,
-                encoding=encoding,
-                engine="python" if suffix == ".txt" else "c",
-            )
 
-            chunks = []
+            chunks = _ChunkAccumulator(bounded_memory, max_memory_mb)
             rows_read = 0
-            for chunk in reader:
-                chunks.append(chunk)
-                rows_read += len(chunk)
-                if progress_fn and total_rows > 0:
-                    progress = min(rows_read / total_rows * 100, 99)
-                    progress_fn(progress, "Loading data")
-                    logger.debug("Loaded %s/%s rows", rows_read, total_rows)
-                    print(f"[Data Handler] Loaded {rows_read}/{total_rows} rows")
-
-            df = pd.concat(chunks, ignore_index=True)
+            with open(file_path, "rb") as handle:
+                for chunk in _iter_text_chunks(
+                    handle, sep, encoding, engine, usecols=read_cols
+                ):
+                    if filters:
+                        chunk = _apply_filters(chunk, filters)
+                    if usecols:
+                        chunk = chunk[usecols]
+                    chunks.add(chunk)
+                    rows_read += len(chunk)
+                    del chunk
+                    if not progress_fn:
+                        continue
+                    if single_pass and total_bytes > 0:
+                        progress = min(handle.tell() / total_bytes * 100, 99)
+                        progress_fn(progress, "Loading data")
+                        logger.debug("Loaded %s rows (%.2f%%)", rows_read, progress)
+                        print(f"[Data Handler] Loaded {rows_read} rows ({progress:.0f}%)")
+                    elif total_rows > 0:
+                        progress = min(rows_read / total_rows * 100, 99)
+                        progress_fn(progress, "Loading data")
+                        logger.debug("Loaded %s/%s rows", rows_read, total_rows)
+                        print(f"[Data Handler] Loaded {rows_read}/{total_rows} rows")
+
+            df = chunks.finish()
 
         elif suffix in {".xls", ".xlsx"}:
             if progress_fn:
                 progress_fn(10, "Reading Excel")
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, usecols=read_cols)
         elif suffix == ".json":
             if progress_fn:
                 progress_fn(10, "Reading JSON")
@@ -249,10 +780,31 @@ def load_data(
         elif suffix in {".parquet", ".pq"}:
             if progress_fn:
                 progress_fn(10, "Reading Parquet")
-            df = pd.read_parquet(file_path)
+            df = pd.read_parquet(file_path, columns=usecols, filters=filters or None)
         else:
             raise ValueError("Unsupported file format")
 
+        if not snapshot and suffix not in {".csv", ".tsv", ".txt", ".parquet", ".pq"}:
+            if filters:
+                df = _apply_filters(df, filters).reset_index(drop=True)
+            if usecols:
+                df = df[usecols]
+
+        if compact and not snapshot:
+            if progress_fn:
+                progress_fn(99, "Compacting dtypes")
+            df = compact_dataframe(df)
+
+        if env and not snapshot:
+            if progress_fn:
+                progress_fn(99, "Saving snapshot")
+            profile = _save_snapshot(env, df, file_path, options)
+
+        # Identify the result for the analysis profile cache; reloading the
+        # file starts a fresh profile.
+        _stamp_profile_key(df, [file_path], options)
+        _seed_profile(df, profile)
+
         if suffix != ".csv":
             csv_path = convert_to_csv(df, file_path)
             save_filepath(csv_path)
@@ -277,13 +829,25 @@ def get_data_stats(df, file_path):
         row_count = len(df)
         file_size = os.path.getsize(file_path) / (1024 * 1024)
 
-        return {
+        stats = {
             "row_count": row_count,
             "file_size": file_size,
             "log1": f"[Data Handler] Loaded {row_count} rows.",
             "log2": f"[Data Handler] File size: {file_size:.2f} MB",
         }
 
+        # Populated by ``compact_dataframe`` when the data was compacted.
+        if "memory_before" in df.attrs:
+            before = df.attrs["memory_before"] / (1024 * 1024)
+            after = df.attrs["memory_after"] / (1024 * 1024)
+            stats["memory_before"] = before
+            stats["memory_after"] = after
+            stats["log3"] = (
+                f"[Data Handler] Memory: {before:.2f} MB -> {after:.2f} MB"
+            )
+
+        return stats
+
     except Exception as e:
         logger.error(f"Error getting data stats: {e}")
         return {
@@ -294,14 +858,317 @@ def get_data_stats(df, file_path):
         }
 
 
+# Chunk output formats mapped to the compression applied to the CSV text.
+# Parquet chunks are written from parsed DataFrames instead.
+CHUNK_FORMATS = {
+    "csv": None,
+    "csv.gz": "gzip",
+    "csv.zst": "zstd",
+    "parquet": None,
+}
+
+
+def _open_chunk_output(output_file: str, compression: str | None = None):
+    """Open ``output_file`` for binary writing with optional compression."""
+    if compression == "gzip":
+        return gzip.open(output_file, "wb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd chunk output requires the 'zstandard' package") from e
+        return zstandard.ZstdCompressor().stream_writer(open(output_file, "wb"))
+    return open(output_file, "wb")
+
+
+def _write_chunk_csv(
+    output_file: str, header: list, rows: list, compression: str | None = None
+) -> None:
+    """Write ``header`` and ``rows`` to ``output_file`` as CSV."""
+    with io.TextIOWrapper(
+        _open_chunk_output(output_file, compression), encoding="utf-8", newline=""
+    ) as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _write_chunk_bytes(
+    output_file: str, header: bytes, blocks: list, compression: str | None = None
+) -> None:
+    """Write a raw ``header`` line followed by the byte ``blocks``."""
+    with _open_chunk_output(output_file, compression) as outfile:
+        outfile.write(header)
+        # zstandard's stream writer does not implement ``writelines``.
+        for block in blocks:
+            outfile.write(block)
+
+
+def _write_chunk_parquet(
+    output_file: str, frame: pd.DataFrame, row_group_size: int | None = None
+) -> None:
+    """Write ``frame`` to ``output_file`` as Parquet."""
+    frame.to_parquet(output_file, index=False, row_group_size=row_group_size)
+
+
+def _estimate_rows_per_chunk(input_file: str, chunk_size_bytes: int) -> int:
+    """Estimate how many rows fit in ``chunk_size_bytes`` from a 1 MB sample."""
+    with open(input_file, "rb") as f:
+        sample = f.read(1024 * 1024)
+    lines = max(sample.count(b"\n"), 1)
+    return max(1, int(chunk_size_bytes / (len(sample) / lines)))
+
+
+# Bytes read per ``read`` call when copying raw byte ranges.
+_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Scanner states carried from one buffer to the next.  A quote only opens a
+# quoted field at the start of a field, as in ``csv`` and pandas; a quote
+# right after a closing quote is an escaped (doubled) quote.
+_FIELD_START, _IN_FIELD, _IN_QUOTES, _QUOTE_CLOSED = range(4)
+_FIELD_SEPARATORS = b",\n\r"
+
+
+def _unquoted_spans(buf: bytes, state: int) -> tuple[list, int]:
+    """Return the ``(start, end)`` spans of ``buf`` outside quoted fields.
+
+    ``state`` is the scanner state at the start of ``buf``; the state at its
+    end is returned alongside the spans.
+    """
+    in_quotes = state == _IN_QUOTES
+    closed_at = -1 if state == _QUOTE_CLOSED else -2
+    spans = []
+    start = 0
+    i = buf.find(b'"')
+    while i >= 0:
+        if in_quotes:
+            in_quotes = False
+            closed_at = i
+            start = i + 1
+        elif (
+            (buf[i - 1] in _FIELD_SEPARATORS if i else state == _FIELD_START)
+            or closed_at == i - 1
+        ):
+            in_quotes = True
+            spans.append((start, i))
+        i = buf.find(b'"', i + 1)
+    if not buf:
+        return spans, state
+    if in_quotes:
+        return spans, _IN_QUOTES
+    spans.append((start, len(buf)))
+    if closed_at == len(buf) - 1:
+        return spans, _QUOTE_CLOSED
+    return spans, _FIELD_START if buf[-1] in _FIELD_SEPARATORS else _IN_FIELD
+
+
+def _count_records(buf: bytes, state: int) -> tuple[int, int]:
+    """Count record terminators in ``buf`` that fall outside quoted fields.
+
+    Returns the count and the scanner state at the end of ``buf``.
+    """
+    if b'"' not in buf and state != _IN_QUOTES:
+        end_state = state
+        if buf:
+            end_state = _FIELD_START if buf[-1] in _FIELD_SEPARATORS else _IN_FIELD
+        return buf.count(b"\n"), end_state
+    spans, state = _unquoted_spans(buf, state)
+    return sum(buf.count(b"\n", lo, hi) for lo, hi in spans), state
+
+
+def _find_record_end(buf: bytes, state: int) -> tuple[int, int]:
+    """Return the offset of the first unquoted newline in ``buf`` or ``-1``."""
+    spans, end_state = _unquoted_spans(buf, state)
+    for lo, hi in spans:
+        end = buf.find(b"\n", lo, hi)
+        if end >= 0:
+            return end, _FIELD_START
+    return -1, end_state
+
+
+def _read_record_tail(
+    infile, state: int, limit: int | None = None, step: int = 64 * 1024
+) -> list | None:
+    """Read from ``infile`` up to and including the next record terminator.
+
+    ``infile`` is left positioned just after the terminator.  Returns
+    ``None`` when no terminator turns up within ``limit`` bytes, which
+    points at quoting the scanner cannot follow.
+    """
+    blocks = []
+    size = 0
+    while True:
+        buf = infile.read(step)
+        if not buf:
+            return blocks
+        end, state = _find_record_end(buf, state)
+        if end >= 0:
+            blocks.append(buf[: end + 1])
+            infile.seek(end + 1 - len(buf), os.SEEK_CUR)
+            return blocks
+        blocks.append(buf)
+        size += len(buf)
+        if limit is not None and size > limit:
+            return None
+
+
+# Name of the manifest written next to the chunk files.
+CHUNK_MANIFEST = "manifest.json"
+
+
+def _file_digest(path, block_size: int = _BLOCK_SIZE) -> str:
+    """Return the SHA-256 hex digest of ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(partial(f.read, block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_fingerprint(path, sample_bytes: int = 1024 * 1024) -> dict:
+    """Identify a source file by size, mtime and a hash of its head and tail.
+
+    Hashing only the first and last ``sample_bytes`` keeps reruns on very
+    large files cheap while still catching edits that keep size and mtime.
+    """
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(sample_bytes))
+        if stat.st_size > sample_bytes:
+            f.seek(max(sample_bytes, stat.st_size - sample_bytes))
+            digest.update(f.read())
+    return {
+        "path": str(Path(path).resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sample_sha256": digest.hexdigest(),
+    }
+
+
+def load_chunk_manifest(output_dir) -> dict | None:
+    """Return the chunk manifest stored in ``output_dir`` if there is one."""
+    manifest_path = Path(output_dir) / CHUNK_MANIFEST
+    if not manifest_path.exists():
+        return None
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning("Ignoring unreadable manifest %s", manifest_path)
+        return None
+
+
+def locate_chunk(output_dir, row: int) -> Path | None:
+    """Return the chunk file holding data row ``row`` (0-based) using the manifest."""
+    manifest = load_chunk_manifest(output_dir)
+    if not manifest:
+        return None
+    for entry in manifest["chunks"]:
+        if entry["row_start"] <= row < entry["row_end"]:
+            return Path(output_dir) / entry["file"]
+    return None
+
+
+def _valid_chunk_prefix(manifest, output_dir) -> list:
+    """Return the leading manifest entries whose chunk files are intact."""
+    valid = []
+    for entry in manifest.get("chunks", []):
+        chunk = Path(output_dir) / entry["file"]
+        if not chunk.exists() or chunk.stat().st_size != entry.get("size"):
+            break
+        valid.append(entry)
+    return valid
+
+
+def _manifest_matches(manifest, fingerprint: dict, settings: dict) -> bool:
+    """Check a previous manifest was written for this source and settings."""
+    return (
+        bool(manifest)
+        and manifest.get("source") == fingerprint
+        and manifest.get("settings") == settings
+    )
+
+
+def _manifest_is_current(manifest, fingerprint: dict, settings: dict, output_dir) -> bool:
+    """Check a previous, finished run still describes ``fingerprint``."""
+    if not _manifest_matches(manifest, fingerprint, settings):
+        return False
+    if not manifest.get("complete", True):
+        return False
+    return len(_valid_chunk_prefix(manifest, output_dir)) == len(manifest["chunks"])
+
+
+def _write_manifest(
+    manifest_path, fingerprint, settings, total_rows, entries, complete=True
+):
+    """Atomically write the chunk manifest.
+
+    Incomplete manifests act as checkpoints: they list only chunks that are
+    fully on disk so an interrupted run can resume after the last of them.
+    """
+    manifest = {
+        "version": 1,
+        "complete": complete,
+        "source": fingerprint,
+        "settings": settings,
+        "total_rows": total_rows,
+        "chunks": entries,
+    }
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+    logger.debug("Chunk manifest written -> %s", manifest_path)
+
+
 def split_into_chunks(
-    dataset_name, input_file, chunk_size_mb=256, logger_fn=None, progress_fn=None
+    dataset_name,
+    input_file,
+    chunk_size_mb=256,
+    logger_fn=None,
+    progress_fn=None,
+    writer_threads=0,
+    byte_ranges=False,
+    cancel_event=None,
+    output_format="csv",
+    rows_per_chunk=None,
+    row_group_size=None,
 ):
     """Split a CSV into smaller chunks with optional progress updates.
 
     Progress callbacks are throttled to roughly one percent increments to
     avoid overwhelming the UI while still providing frequent feedback.
 
+    With ``writer_threads`` greater than zero parsing and writing are
+    pipelined: completed chunks are handed to a pool of writer threads
+    while the next chunk is parsed.  At most ``2 * writer_threads`` chunks
+    are queued at once so memory stays bounded.  File names and contents
+    are identical to the synchronous mode.
+
+    With ``byte_ranges=True`` rows are not parsed at all.  Each chunk is a
+    raw byte range of the source, extended to the next record terminator
+    outside a quoted field, and copied verbatim after the header line.
+    This is much faster and sizes chunks by their true on-disk size.  If
+    a record runs on for more than a whole chunk, the quoting is taken to
+    be beyond the byte scanner and the file is split row by row instead.
+
+    A ``manifest.json`` is written into the ``chunks`` folder describing the
+    source file and each chunk's row range, source byte range (byte-range
+    mode only), size and SHA-256.  When a later run finds a manifest for an
+    unchanged source with the same settings and intact chunk files, the
+    existing chunks are reused instead of being written again.
+
+    The manifest is also rewritten as a checkpoint after every chunk.  If a
+    run is interrupted or cancelled through ``cancel_event``, the next run
+    with the same source and settings keeps the chunks already written and
+    resumes after the last one.
+
+    Chunks can be written as plain, gzip or zstd compressed CSV, or as
+    Parquet (see ``CHUNK_FORMATS``).  Parquet chunks are parsed with pandas
+    so column types are kept; their size comes from ``rows_per_chunk`` or
+    is estimated from ``chunk_size_mb``.  Setting ``rows_per_chunk`` for
+    CSV output cuts chunks by row count instead of size, which requires
+    the row-by-row mode.
+
     Parameters
     ----------
     dataset_name : str
@@ -314,13 +1181,35 @@ def split_into_chunks(
         Function used for log messages. ``print`` is used when omitted.
     progress_fn : callable, optional
         Callback invoked with ``(percent, message)`` as the file is processed.
+    writer_threads : int, optional
+        Number of background threads writing chunk files. ``0`` (the
+        default) writes each chunk on the calling thread.
+    byte_ranges : bool, optional
+        Split on raw byte boundaries instead of re-serializing parsed rows.
+    cancel_event : threading.Event, optional
+        When set, chunking stops after the chunks already queued are
+        written.  The result then contains ``"cancelled": True``.
+    output_format : str, optional
+        One of ``CHUNK_FORMATS``. Defaults to ``"csv"``.
+    rows_per_chunk : int, optional
+        Number of data rows per chunk instead of a size in megabytes.
+    row_group_size : int, optional
+        Rows per Parquet row group. Uses the pyarrow default when omitted.
     """
 
+    if output_format not in CHUNK_FORMATS:
+        raise ValueError(f"output_format must be one of {', '.join(CHUNK_FORMATS)}")
+    compression = CHUNK_FORMATS[output_format]
+
+    executor = ThreadPoolExecutor(writer_threads) if writer_threads > 0 else None
+    pending = []
+    slots = threading.BoundedSemaphore(2 * writer_threads) if executor else None
+
     try:
         paths = create_dataset_environment(dataset_name)
         output_dir = paths["chunks"]
 
-        chunk_size_bytes = chunk_size_mb * 1024 * 1024
+        chunk_size_bytes = max(1, int(chunk_size_mb * 1024 * 1024))
         base_filename = os.path.splitext(os.path.basename(input_file))[0]
 
         def log(msg):
@@ -329,14 +1218,257 @@ def split_into_chunks(
             else:
                 print(msg)
 
+        def cancelled():
+            return cancel_event is not None and cancel_event.is_set()
+
+        manifest_path = output_dir / CHUNK_MANIFEST
+        fingerprint = _source_fingerprint(input_file)
+        if rows_per_chunk and byte_ranges and output_format != "parquet":
+            log("rows_per_chunk needs row parsing; byte-range mode disabled.")
+            byte_ranges = False
+        settings = {
+            "chunk_size_mb": chunk_size_mb,
+            "byte_ranges": byte_ranges,
+            "output_format": output_format,
+            "rows_per_chunk": rows_per_chunk,
+            "row_group_size": row_group_size,
+        }
+        previous = load_chunk_manifest(output_dir)
+        if _manifest_is_current(previous, fingerprint, settings, output_dir):
+            log("Source unchanged since last run; reusing existing chunks.")
+            if progress_fn:
+                progress_fn(100, "Chunks up to date")
+            return {
+                "total_rows": previous["total_rows"],
+                "total_chunks": len(previous["chunks"]),
+                "output_dir": str(output_dir),
+                "manifest": str(manifest_path),
+            }
+
+        # Chunks from an interrupted run of the same source can be kept.
+        entries = []
+        if _manifest_matches(previous, fingerprint, settings):
+            entries = _valid_chunk_prefix(previous, output_dir)
+
+        # Remove chunks from an earlier run so none are left behind when the
+        # new run produces fewer files.
+        stale = {p.name for p in output_dir.glob(f"{base_filename}_chunk_*")}
+        if previous:
+            stale.update(entry["file"] for entry in previous["chunks"])
+        stale.difference_update(entry["file"] for entry in entries)
+        for name in stale:
+            (output_dir / name).unlink(missing_ok=True)
+        if not entries:
+            manifest_path.unlink(missing_ok=True)
+
+        checkpoint_lock = threading.Lock()
+
+        def checkpoint():
+            """Record the chunks that are fully written, in order."""
+            with checkpoint_lock:
+                done = []
+                for entry in list(entries):
+                    if "sha256" not in entry:
+                        break
+                    done.append(entry)
+                rows = done[-1]["row_end"] if done else 0
+                _write_manifest(
+                    manifest_path, fingerprint, settings, rows, done, complete=False
+                )
+
+        def write_chunk(index, writer, nrows, label="Chunk", byte_range=None):
+            """Run ``writer(output_file)`` now or on a writer thread."""
+            output_file = os.path.join(
+                output_dir, f"{base_filename}_chunk_{index}.{output_format}"
+            )
+            row_start = entries[-1]["row_end"] if entries else 0
+            entry = {
+                "index": index,
+                "file": os.path.basename(output_file),
+                "row_start": row_start,
+                "row_end": row_start + nrows,
+                "byte_start": byte_range[0] if byte_range else None,
+                "byte_end": byte_range[1] if byte_range else None,
+            }
+            entries.append(entry)
+
+            def run():
+                writer(output_file)
+                entry["size"] = os.path.getsize(output_file)
+                entry["sha256"] = _file_digest(output_file)
+                log(f"{label} {index} written: {nrows} rows")
+                checkpoint()
+
+            if executor is None:
+                run()
+                return
+
+            def job():
+                try:
+                    run()
+                finally:
+                    slots.release()
+
+            # Blocks while the queue of unwritten chunks is full.
+            slots.acquire()
+            pending.append(executor.submit(job))
+
+        def finish(row_count, total_chunks):
+            # Surface any error raised on a writer thread.
+            for future in pending:
+                future.result()
+
+            if cancelled():
+                checkpoint()
+                log(f"Chunking cancelled after {len(entries)} chunks; rerun to resume.")
+                return {
+                    "total_rows": entries[-1]["row_end"] if entries else 0,
+                    "total_chunks": len(entries),
+                    "output_dir": str(output_dir),
+                    "manifest": str(manifest_path),
+                    "cancelled": True,
+                }
+
+            _write_manifest(manifest_path, fingerprint, settings, row_count, entries)
+            log(f"All chunks written. Total rows: {row_count}")
+            log(f"Output directory contents: {os.listdir(output_dir)}")
+            if progress_fn:
+                progress_fn(100, "Chunking complete")
+            return {
+                "total_rows": row_count,
+                "total_chunks": total_chunks,
+                "output_dir": str(output_dir),
+                "manifest": str(manifest_path),
+            }
+
         log(f"Reading from: {input_file}")
         log(f"Writing chunks to: {output_dir}")
         log(f"Chunk size: {chunk_size_mb} MB")
+        if entries:
+            log(
+                f"Resuming after chunk {entries[-1]['index']} "
+                f"(row {entries[-1]['row_end']})"
+            )
         if progress_fn:
             progress_fn(0, "Starting chunking")
 
         total_bytes = os.path.getsize(input_file)
 
+        if output_format == "parquet":
+            rows = rows_per_chunk or _estimate_rows_per_chunk(
+                input_file, chunk_size_bytes
+            )
+            chunk_index = len(entries)
+            row_count = entries[-1]["row_end"] if entries else 0
+            with open(input_file, "rb") as infile:
+                reader = pd.read_csv(
+                    infile,
+                    chunksize=rows,
+                    skiprows=range(1, row_count + 1) if row_count else None,
+                )
+                for frame in reader:
+                    if cancelled():
+                        break
+                    writer = partial(
+                        _write_chunk_parquet, frame=frame, row_group_size=row_group_size
+                    )
+                    write_chunk(chunk_index, writer, len(frame))
+                    chunk_index += 1
+                    row_count += len(frame)
+                    if progress_fn and total_bytes > 0:
+                        progress_fn(
+                            min(infile.tell() / total_bytes * 100, 99), "Chunking"
+                        )
+                    del frame, writer
+
+            return finish(row_count, chunk_index)
+
+        if byte_ranges:
+
+            def rows_instead():
+                """Redo the split row by row after a runaway record."""
+                for future in pending:
+                    future.result()
+                log("Record longer than a chunk; falling back to row-by-row mode.")
+                return split_into_chunks(
+                    dataset_name,
+                    input_file,
+                    chunk_size_mb=chunk_size_mb,
+                    logger_fn=logger_fn,
+                    progress_fn=progress_fn,
+                    writer_threads=writer_threads,
+                    byte_ranges=False,
+                    cancel_event=cancel_event,
+                    output_format=output_format,
+                    rows_per_chunk=rows_per_chunk,
+                    row_group_size=row_group_size,
+                )
+
+            with open(input_file, "rb") as infile:
+                header = _read_record_tail(infile, _FIELD_START, chunk_size_bytes)
+                if header is None:
+                    return rows_instead()
+                header_bytes = b"".join(header)
+                if not header_bytes.strip():
+                    log("Error: File is empty or missing a header.")
+                    return {
+                        "total_rows": 0,
+                        "total_chunks": 0,
+                        "output_dir": str(output_dir),
+                    }
+
+                chunk_index = len(entries)
+                row_count = entries[-1]["row_end"] if entries else 0
+                if entries:
+                    infile.seek(entries[-1]["byte_end"])
+                while not cancelled():
+                    chunk_start = infile.tell()
+                    blocks = []
+                    size = 0
+                    nrows = 0
+                    state = _FIELD_START
+                    while size < chunk_size_bytes:
+                        buf = infile.read(min(_BLOCK_SIZE, chunk_size_bytes - size))
+                        if not buf:
+                            break
+                        found, state = _count_records(buf, state)
+                        nrows += found
+                        size += len(buf)
+                        blocks.append(buf)
+                    if not blocks:
+                        break
+
+                    # Finish the record the size limit landed in.  A tail as
+                    # long as a whole chunk means the quoting went astray.
+                    if state == _IN_QUOTES or not blocks[-1].endswith(b"\n"):
+                        tail = _read_record_tail(infile, state, chunk_size_bytes)
+                        if tail is None:
+                            return rows_instead()
+                        blocks.extend(tail)
+                        nrows += 1
+
+                    writer = partial(
+                        _write_chunk_bytes,
+                        header=header_bytes,
+                        blocks=blocks,
+                        compression=compression,
+                    )
+                    write_chunk(
+                        chunk_index,
+                        writer,
+                        nrows,
+                        byte_range=(chunk_start, infile.tell()),
+                    )
+                    chunk_index += 1
+                    row_count += nrows
+
+                    if progress_fn and total_bytes > 0:
+                        progress_fn(
+                            min(infile.tell() / total_bytes * 100, 99), "Chunking"
+                        )
+
+            return finish(row_count, chunk_index)
+
         with open(input_file, "r", encoding="utf-8") as infile:
             reader = csv.reader(infile)
             try:
@@ -349,28 +1481,37 @@ def split_into_chunks(
                     "output_dir": str(output_dir),
                 }
 
-            chunk_index = 0
+            chunk_index = len(entries)
             current_chunk = []
             current_chunk_size = 0
-            row_count = 0
+            row_count = entries[-1]["row_end"] if entries else 0
             bytes_read = 0
             # Track last reported progress to throttle updates to ~1% steps
             last_percent = 0
 
+            # Rows already in kept chunks are parsed but not written again.
+            for row in itertools.islice(reader, row_count):
+                bytes_read += len(",".join(row).encode("utf-8"))
+
             for row in tqdm(reader, desc="Splitting CSV", unit="rows"):
+                if cancelled():
+                    current_chunk = []
+                    break
+
                 row_size = len(",".join(row).encode("utf-8"))
 
-                if current_chunk_size + row_size > chunk_size_bytes:
-                    output_file = os.path.join(
-                        output_dir, f"{base_filename}_chunk_{chunk_index}.csv"
+                if rows_per_chunk:
+                    full = len(current_chunk) >= rows_per_chunk
+                else:
+                    full = current_chunk_size + row_size > chunk_size_bytes
+                if full:
+                    writer = partial(
+                        _write_chunk_csv,
+                        header=header,
+                        rows=current_chunk,
+                        compression=compression,
                     )
-                    with open(
-                        output_file, "w", encoding="utf-8", newline=""
-                    ) as outfile:
-                        writer = csv.writer(outfile)
-                        writer.writerow(header)
-                        writer.writerows(current_chunk)
-                    log(f"Chunk {chunk_index} written: {len(current_chunk)} rows")
+                    write_chunk(chunk_index, writer, len(current_chunk))
 
                     chunk_index += 1
                     current_chunk = []
@@ -390,29 +1531,17 @@ def split_into_chunks(
 
             # Final chunk
             if current_chunk:
-                output_file = os.path.join(
-                    output_dir, f"{base_filename}_chunk_{chunk_index}.csv"
+                writer = partial(
+                    _write_chunk_csv,
+                    header=header,
+                    rows=current_chunk,
+                    compression=compression,
                 )
-                with open(output_file, "w", encoding="utf-8", newline="") as outfile:
-                    writer = csv.writer(outfile)
-                    writer.writerow(header)
-                    writer.writerows(current_chunk)
-                log(f"Final chunk {chunk_index} written: {len(current_chunk)} rows")
-                bytes_read += sum(
-                    len(",".join(r).encode("utf-8")) for r in current_chunk
+                write_chunk(
+                    chunk_index, writer, len(current_chunk), label="Final chunk"
                 )
 
-        log(f"All chunks written. Total rows: {row_count}")
-        log(f"Output directory contents: {os.listdir(output_dir)}")
-
-        if progress_fn:
-            progress_fn(100, "Chunking complete")
-
-        return {
-            "total_rows": row_count,
-            "total_chunks": chunk_index + 1,
-            "output_dir": str(output_dir),
-        }
+        return finish(row_count, chunk_index + 1)
 
     except FileNotFoundError as e:
         logging.error(f"File not found: {e}")
@@ -426,10 +1555,240 @@ def split_into_chunks(
         logging.error(f"Unexpected error: {e}")
         if logger_fn:
             logger_fn(f"Unexpected error: {e}")
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     return {"total_rows": 0, "total_chunks": 0, "output_dir": ""}
 
 
+def _is_parquet(path: str) -> bool:
+    return Path(path).suffix.lower() in {".parquet", ".pq"}
+
+
+def _read_part(path: str, row_group=None, columns=None, dtypes=None) -> pd.DataFrame:
+    """Read one chunk file, or one row group of a Parquet file.
+
+    The chunk is parsed with its own inferred types and then cast to the
+    combined ``dtypes``, as ``pd.concat`` would.  Parsing straight into
+    ``dtypes`` would keep the raw text of a column promoted to ``object``
+    (``"0000"`` rather than ``0``) where the in-memory frame holds numbers.
+    """
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        frame = pq.ParquetFile(path).read_row_group(row_group, columns=columns).to_pandas()
+    else:
+        frame = pd.read_csv(path, usecols=columns)
+    for col, dtype in (dtypes or {}).items():
+        if frame[col].dtype != dtype:
+            frame[col] = frame[col].astype(dtype)
+    return frame
+
+
+def _scan_part(path: str, row_group=None) -> tuple[int, pd.DataFrame, list]:
+    """Return the row count, first row and blank column positions of a CSV chunk."""
+    part = _read_part(path, row_group)
+    blank = np.flatnonzero(part.isna().all().to_numpy()).tolist()
+    return len(part), part.iloc[:1], blank
+
+
+def _parquet_blank_columns(pf) -> list:
+    """Positions of columns a Parquet file's statistics show to be all null."""
+    meta = pf.metadata
+    names = pf.schema_arrow.names
+    blank = []
+    for j in range(meta.num_columns):
+        for g in range(meta.num_row_groups):
+            stats = meta.row_group(g).column(j).statistics
+            rows = meta.row_group(g).num_rows
+            if stats is None or not stats.has_null_count or stats.null_count != rows:
+                break
+        else:
+            name = pf.schema.column(j).path
+            if name in names:
+                blank.append(names.index(name))
+    return blank
+
+
+def _promote_dtypes(heads: list, blanks: list) -> pd.Series:
+    """Combine chunk dtypes the way ``pd.concat`` over the chunks would.
+
+    Columns that are blank throughout a chunk are parsed as ``float64`` there
+    and say nothing about the column's type, so the type comes from the
+    other chunks (unless the column is blank in every chunk).  Those blanks
+    still need a missing value: integers become ``float64`` and booleans
+    ``object``, matching what a single read of the whole file gives.
+    """
+    dtypes = pd.concat(heads, ignore_index=True).dtypes
+    for i in range(len(dtypes)):
+        filled = [h.iloc[:, [i]] for h, b in zip(heads, blanks) if i not in b]
+        if filled and len(filled) < len(heads):
+            dtype = pd.concat(filled, ignore_index=True).dtypes.iloc[0]
+            if isinstance(dtype, np.dtype) and dtype.kind == "b":
+                dtype = np.dtype(object)
+            elif isinstance(dtype, np.dtype) and dtype.kind in "iu":
+                dtype = np.dtype("float64")
+            dtypes.iloc[i] = dtype
+    return dtypes
+
+
+class ChunkedDataset:
+    """Lazy, out-of-core view over a dataset stored as several files.
+
+    The dataset is backed either by the ``{base}_chunk_{i}.csv`` files that
+    ``split_into_chunks`` writes or by Parquet files, whose row groups are
+    read one at a time.  Nothing is held in memory between calls; consumers
+    such as ``run_analysis``, ``search_dataframe``, ``export_dataframe`` and
+    ``get_data_stats`` iterate ``iter_chunks`` instead.
+
+    Each chunk carries a global ``RangeIndex`` so row labels match those of
+    the equivalent in-memory DataFrame.  CSV chunks are scanned once on first
+    use to determine the combined dtypes (the same promotion ``pd.concat``
+    would apply) and every chunk is then cast to those dtypes after parsing
+    so results agree with the materialized path.
+
+    ``map_parts`` runs a function over every chunk in a process pool, which
+    ``run_analysis`` uses to spread per-chunk work across CPU cores.
+    """
+
+    def __init__(self, paths):
+        self.paths = [str(p) for p in paths]
+        if not self.paths:
+            raise ValueError("ChunkedDataset needs at least one file")
+        self.attrs = {}
+        self._dtypes = None
+        self._nrows = None
+        self._parts = None
+
+    @classmethod
+    def from_chunks_dir(cls, output_dir) -> "ChunkedDataset":
+        """Open the chunk files written by ``split_into_chunks``."""
+        manifest = load_chunk_manifest(output_dir)
+        if manifest:
+            files = [Path(output_dir) / e["file"] for e in manifest["chunks"]]
+        else:
+            files = [
+                p for p in Path(output_dir).iterdir()
+                if re.search(r"_chunk_\d+\.(csv|csv\.gz|csv\.zst|parquet)$", p.name)
+            ]
+            files.sort(
+                key=lambda p: int(re.search(r"_chunk_(\d+)\.", p.name).group(1))
+            )
+        ds = cls(files)
+        _stamp_profile_key(ds, ds.paths)
+        return ds
+
+    @classmethod
+    def from_parquet(cls, path) -> "ChunkedDataset":
+        """Open a single Parquet file, reading one row group at a time."""
+        ds = cls([path])
+        _stamp_profile_key(ds, ds.paths)
+        return ds
+
+    @property
+    def parts(self) -> list[tuple[str, int | None]]:
+        """``(path, row_group)`` pairs in row order; ``row_group`` is ``None`` for CSV."""
+        if self._parts is None:
+            parts = []
+            for path in self.paths:
+                if _is_parquet(path):
+                    import pyarrow.parquet as pq
+
+                    count = pq.ParquetFile(path).num_row_groups
+                    parts.extend((path, i) for i in range(count))
+                else:
+                    parts.append((path, None))
+            self._parts = parts
+        return self._parts
+
+    def map_parts(self, fn, *args, workers: int = 0):
+        """Yield ``fn(path, row_group, *args)`` for every part, in order.
+
+        With ``workers`` greater than one the calls run in a process pool, so
+        ``fn`` must be a picklable module level function.
+        """
+        parts = self.parts
+        columns = [itertools.repeat(a, len(parts)) for a in args]
+        paths = [p for p, _ in parts]
+        groups = [g for _, g in parts]
+        if workers and workers > 1 and len(parts) > 1:
+            with ProcessPoolExecutor(min(workers, len(parts))) as pool:
+                yield from pool.map(fn, paths, groups, *columns)
+        else:
+            yield from map(fn, paths, groups, *columns)
+
+    def scan(self, workers: int = 0) -> None:
+        """Determine combined dtypes and the total row count."""
+        heads = []
+        blanks = []
+        nrows = 0
+        for path in self.paths:
+            if _is_parquet(path):
+                import pyarrow.parquet as pq
+
+                # Parquet carries its schema, row count and null counts in
+                # the footer.
+                pf = pq.ParquetFile(path)
+                nrows += pf.metadata.num_rows
+                heads.append(pf.schema_arrow.empty_table().to_pandas())
+                blanks.append(_parquet_blank_columns(pf))
+        csv_paths = [p for p in self.paths if not _is_parquet(p)]
+        if csv_paths:
+            csv_parts = ChunkedDataset(csv_paths)
+            for count, head, blank in csv_parts.map_parts(_scan_part, workers=workers):
+                nrows += count
+                heads.append(head)
+                blanks.append(blank)
+        self._dtypes = _promote_dtypes(heads, blanks)
+        self._nrows = nrows
+        logger.info("Scanned %s chunk files: %s rows", len(self.paths), nrows)
+
+    @property
+    def dtypes(self) -> pd.Series:
+        if self._dtypes is None:
+            self.scan()
+        return self._dtypes
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.dtypes.index
+
+    def __len__(self) -> int:
+        if self._nrows is None:
+            self.scan()
+        return self._nrows
+
+    def iter_chunks(self, columns=None):
+        """Yield chunks as DataFrames indexed by global row position."""
+        dtypes = self.dtypes
+        if columns is not None:
+            dtypes = dtypes[columns]
+        dtypes = dtypes.to_dict()
+        offset = 0
+        for path, row_group in self.parts:
+            part = _read_part(path, row_group, columns, dtypes)
+            part.index = pd.RangeIndex(offset, offset + len(part))
+            offset += len(part)
+            yield part
+
+
+    def take(self, positions, columns=None) -> pd.DataFrame:
+        """Return the rows at the given global ``positions`` in that order."""
+        wanted = pd.Index(positions, dtype="int64")
+        last = wanted.max() if len(wanted) else -1
+        found = []
+        for chunk in self.iter_chunks(columns):
+            hit = wanted[(wanted >= chunk.index.start) & (wanted < chunk.index.stop)]
+            found.append(chunk.loc[hit.unique()])
+            if chunk.index.stop > last:
+                break
+        return pd.concat(found).loc[wanted]
+
+    def head(self, n: int = 5, columns=None) -> pd.DataFrame:
+        return self.take(range(min(n, len(self))), columns)
+
+
 # SOURCE APP FUNCTIONALITY BUILDOUT (SEAN)
 PLACEHOLDERS = {
     "N/A",
@@ -449,12 +1808,620 @@ PLACEHOLDERS = {
 }
 
 
+# ----------------------------------------------------------------------
+# Analysis building blocks.  Each ``_*_partial`` function works on a single
+# frame (or chunk) and returns a small result that can be merged with the
+# results from other chunks; the ``_format_*`` helpers render the merged
+# result so the in-memory and chunked paths produce identical reports.
+# ----------------------------------------------------------------------
+def _format_preview(dtypes: pd.Series, preview: pd.DataFrame) -> str:
+    rows = [(c, str(t)) for c, t in dtypes.items()]
+    return (
+        "[Data Types]\n"
+        + tabulate(rows, headers=["Column", "Dtype"], tablefmt="fancy_grid")
+        + "\n\n[Preview]\n"
+        + tabulate(preview, headers="keys", tablefmt="fancy_grid")
+    )
+
+
+def _missing_partial(df: pd.DataFrame) -> pd.Series:
+    return df.isnull().sum()
+
+
+def _format_missing(miss: pd.Series, total: int) -> str:
+    rows = [
+        (c, int(cnt), f"{cnt/total*100:.2f}%") for c, cnt in miss.items() if cnt > 0
+    ]
+    if not rows:
+        return "No missing values detected."
+    return (
+        "=== Missing Values ===\n"
+        + tabulate(rows, headers=["Column", "Count", "%"], tablefmt="fancy_grid")
+        + f"\n\nTotal rows: {total}"
+    )
+
+
+def _format_duplicates(stats: dict, sample: pd.DataFrame | None) -> str:
+    total = stats["total_rows"]
+    if not stats["duplicate_entries"]:
+        return f"No duplicates. Checked {total} rows."
+    report = [
+        ["Total Rows", total],
+        ["Duplicate entries", stats["duplicate_entries"]],
+        ["Unique duplicate rows", stats["unique_duplicates"]],
+        ["Duplicate groups", stats["groups"]],
+        ["Largest group", stats["largest_group"]],
+    ]
+    sizes = sorted(stats["group_sizes"].items(), reverse=True)[:10]
+    body = tabulate(sample, headers="keys", tablefmt="fancy_grid")
+    return (
+        "🔍 Duplicate Report\n"
+        + tabulate(report, headers=["Metric", "Value"], tablefmt="fancy_grid")
+        + "\n\n"
+        + tabulate(sizes, headers=["Group size", "Groups"], tablefmt="fancy_grid")
+        + "\n\n"
+        + body
+    )
+
+
+def _numeric_placeholders(placeholders) -> set:
+    """Return the placeholders a numeric value could render as via ``str``."""
+    found = set()
+    for p in placeholders:
+        if p in {"True", "False", "inf", "-inf"}:
+            found.add(p)
+            continue
+        try:
+            if str(int(p)) == p or str(float(p)) == p:
+                found.add(p)
+        except ValueError:
+            pass
+    return found
+
+
+def _placeholder_partial(df: pd.DataFrame, placeholders=None) -> dict:
+    """Count cells per column whose stripped text is a placeholder token.
+
+    Rather than converting every cell to a Python string, each column's
+    distinct values are counted and only those are stringified.  Numeric
+    and boolean columns are skipped outright unless a placeholder could be
+    the text form of a number (e.g. ``"0"``); the defaults never are.
+    Categorical columns are handled through their categories the same way.
+    Missing cells are stringified on their own, so they count exactly as
+    ``astype(str)`` renders them (``None`` reads ``"None"`` on pandas 2).
+    """
+    placeholders = PLACEHOLDERS if placeholders is None else set(placeholders)
+    numeric_tokens = _numeric_placeholders(placeholders)
+    counts = {}
+    for c in df.columns:
+        ser = df[c]
+        if (
+            pd.api.types.is_numeric_dtype(ser) or pd.api.types.is_bool_dtype(ser)
+        ) and not numeric_tokens:
+            counts[c] = 0
+            continue
+        vc = ser.value_counts(dropna=True, sort=False)
+        keys = vc.index.to_series().astype(str).str.strip()
+        counts[c] = int(vc[keys.isin(placeholders).to_numpy()].sum())
+        missing = ser[ser.isna()]
+        if len(missing):
+            text = missing.astype(str).str.strip()
+            counts[c] += int(text.isin(placeholders).sum())
+    return counts
+
+
+def _format_placeholders(counts: dict, total: int) -> str:
+    rec = [[c, cnt, f"{cnt/total*100:.2f}%"] for c, cnt in counts.items() if cnt > 0]
+    if not rec:
+        return "No placeholders found."
+    return tabulate(rec, headers=["Column", "Count", "%"], tablefmt="fancy_grid")
+
+
+def _special_partial(df: pd.DataFrame) -> dict:
+    """Histogram the special (non word, non space) characters per column.
+
+    Works on each column's distinct values: their special characters are
+    extracted with one vectorized ``str.replace``, exploded into single
+    characters and summed, weighted by how often each value occurs.  No
+    joined string of all matching cells is ever built.
+
+    Returns a mapping of column to ``(cells_with_specials, {char: count})``.
+    """
+    pat = r"[\w\s]"
+    stats = {}
+    for c in df.columns:
+        vc = df[c].value_counts(dropna=True, sort=False)
+        counts = vc.reset_index(drop=True)
+        specials = vc.index.to_series().astype(str).reset_index(drop=True)
+        specials = specials.str.replace(pat, "", regex=True)
+        hit = specials.str.len() > 0
+        if not hit.any():
+            stats[c] = (0, {})
+            continue
+        chars = specials[hit].map(list).explode()
+        hist = counts.reindex(chars.index).groupby(chars.to_numpy()).sum()
+        stats[c] = (int(counts[hit].sum()), {ch: int(n) for ch, n in hist.items()})
+    return stats
+
+
+def _format_special(stats: dict) -> str:
+    rec = []
+    for c, (cnt, hist) in stats.items():
+        if not cnt:
+            continue
+        by_freq = sorted(hist.items(), key=lambda kv: (-kv[1], kv[0]))
+        freqs = ", ".join(f"{ch}:{n}" for ch, n in by_freq)
+        rec.append([c, cnt, "".join(sorted(hist)), freqs])
+    if not rec:
+        return "No special characters found."
+    return tabulate(
+        rec, headers=["Column", "Count", "Chars", "Frequencies"], tablefmt="fancy_grid"
+    )
+
+
+def _merge_counts(total: dict, part: dict) -> dict:
+    for c, cnt in part.items():
+        total[c] = total.get(c, 0) + cnt
+    return total
+
+
+def _merge_special(total: dict, part: dict) -> dict:
+    for c, (cnt, hist) in part.items():
+        prev_cnt, prev_hist = total.get(c, (0, {}))
+        total[c] = (prev_cnt + cnt, _merge_counts(dict(prev_hist), hist))
+    return total
+
+
+def _select_columns(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """Return ``df[columns]``, or ``df`` itself when that selects everything.
+
+    Selecting columns copies them on pandas 2 without copy-on-write, which
+    would duplicate the whole frame for an "All Columns" analysis.
+    """
+    columns = list(columns)
+    if columns == list(df.columns):
+        return df
+    return df[columns]
+
+
+def _hash_partial(df: pd.DataFrame, subset=None) -> np.ndarray:
+    if subset:
+        df = _select_columns(df, subset)
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+# Row hashes held in memory before Duplicate Detection spills to disk.
+DUP_SPILL_ROWS = 20_000_000
+# Number of on-disk hash buckets; a bucket is picked by a hash's top bits.
+_DUP_BUCKET_BITS = 6
+_DUP_RECORD = np.dtype([("hash", "<u8"), ("pos", "<i8")])
+
+
+class _DuplicateCounter:
+    """Count equal row hashes, spilling ``(hash, position)`` pairs to disk.
+
+    Hashes are buffered in memory until ``spill_rows`` is exceeded.  After
+    that every batch is partitioned by the top bits of its hashes into
+    bucket files, so equal hashes always land in the same bucket and each
+    bucket can be counted on its own, keeping memory bounded by the size of
+    one bucket rather than the whole dataset.
+
+    Rows are grouped by their 64-bit ``hash_pandas_object`` value alone and
+    never compared cell by cell, so counts are approximate: distinct rows
+    can share a hash by chance (odds of about 2**-64 per pair), and values that
+    ``hash_pandas_object`` stringifies alike (``1`` and ``"1"`` in an object
+    column) count as equal.
+    """
+
+    def __init__(self, num_rows: int, sort_desc: bool, spill_rows, spill_dir):
+        self.num_rows = num_rows
+        self.sort_desc = sort_desc
+        self.spill_rows = DUP_SPILL_ROWS if spill_rows is None else spill_rows
+        self.spill_dir = spill_dir
+        self.buffer = []
+        self.buffered = 0
+        self.offset = 0
+        self.tmp = None
+        self.buckets = None
+
+    def add(self, hashes: np.ndarray) -> None:
+        positions = np.arange(self.offset, self.offset + len(hashes))
+        self.offset += len(hashes)
+        if self.buckets is None and self.buffered + len(hashes) > self.spill_rows:
+            self._start_spill()
+        if self.buckets is None:
+            self.buffer.append(hashes)
+            self.buffered += len(hashes)
+        else:
+            self._spill(hashes, positions)
+
+    def _start_spill(self) -> None:
+        import tempfile
+
+        self.tmp = tempfile.TemporaryDirectory(
+            prefix="datascope_dups_", dir=self.spill_dir
+        )
+        self.buckets = [
+            open(Path(self.tmp.name) / f"bucket_{b}.bin", "wb")
+            for b in range(1 << _DUP_BUCKET_BITS)
+        ]
+        logger.info("Duplicate Detection spilling row hashes to %s", self.tmp.name)
+        buffered, self.buffer = self.buffer, []
+        if buffered:
+            self._spill(np.concatenate(buffered), np.arange(self.buffered))
+
+    def _spill(self, hashes: np.ndarray, positions: np.ndarray) -> None:
+        records = np.empty(len(hashes), dtype=_DUP_RECORD)
+        records["hash"] = hashes
+        records["pos"] = positions
+        bucket_ids = hashes >> np.uint64(64 - _DUP_BUCKET_BITS)
+        order = np.argsort(bucket_ids, kind="stable")
+        bounds = np.searchsorted(
+            bucket_ids[order], np.arange(len(self.buckets) + 1, dtype=np.uint64)
+        )
+        records = records[order]
+        for b, fh in enumerate(self.buckets):
+            if bounds[b + 1] > bounds[b]:
+                records[bounds[b] : bounds[b + 1]].tofile(fh)
+
+    def _count(self, hashes: np.ndarray, positions: np.ndarray, stats: dict) -> None:
+        if not len(hashes):
+            return
+        _, inverse, counts = np.unique(hashes, return_inverse=True, return_counts=True)
+        dup_mask = counts[inverse] > 1
+        group_counts = counts[counts > 1]
+        stats["duplicate_entries"] += int(dup_mask.sum())
+        stats["groups"] += len(group_counts)
+        sizes, freq = np.unique(group_counts, return_counts=True)
+        for size, n in zip(sizes.tolist(), freq.tolist()):
+            stats["group_sizes"][size] = stats["group_sizes"].get(size, 0) + n
+        # Keep only the first (or last) ``num_rows`` duplicate positions.
+        found = np.concatenate([stats["sample_positions"], positions[dup_mask]])
+        found.sort()
+        if self.sort_desc:
+            found = found[::-1]
+        stats["sample_positions"] = found[: self.num_rows]
+
+    def finish(self) -> dict:
+        stats = {
+            "total_rows": self.offset,
+            "duplicate_entries": 0,
+            "groups": 0,
+            "group_sizes": {},
+            "sample_positions": np.empty(0, dtype=np.int64),
+        }
+        try:
+            if self.buckets is None:
+                hashes = (
+                    np.concatenate(self.buffer)
+                    if self.buffer
+                    else np.empty(0, dtype=np.uint64)
+                )
+                self.buffer = []
+                self._count(hashes, np.arange(len(hashes)), stats)
+            else:
+                for fh in self.buckets:
+                    fh.close()
+                for fh in self.buckets:
+                    records = np.fromfile(fh.name, dtype=_DUP_RECORD)
+                    self._count(records["hash"], records["pos"], stats)
+        finally:
+            if self.tmp is not None:
+                self.tmp.cleanup()
+        stats["unique_duplicates"] = stats["duplicate_entries"] - stats["groups"]
+        stats["largest_group"] = max(stats["group_sizes"], default=0)
+        return stats
+
+
+def find_duplicates(
+    data,
+    subset=None,
+    num_rows: int = 10,
+    sort_desc: bool = False,
+    workers: int = 0,
+    spill_rows: int | None = None,
+    spill_dir=None,
+    hashes: np.ndarray | None = None,
+) -> dict:
+    """Find duplicate rows by hashing every row exactly once.
+
+    Rows count as duplicates when their 64-bit row hashes are equal; they
+    are not compared cell by cell afterwards (see ``_DuplicateCounter`` for
+    what that means for hash collisions and mixed-type object columns).
+
+    Parameters
+    ----------
+    data : pd.DataFrame | ChunkedDataset
+        Data to check.  A ``ChunkedDataset`` is hashed chunk by chunk (in a
+        process pool when ``workers`` > 1) and never loaded whole.
+    subset : list[str] | None, optional
+        Columns forming the duplicate key.  ``None`` uses every column.
+    num_rows : int, optional
+        Number of duplicate row positions to return as a sample.
+    sort_desc : bool, optional
+        Sample the last duplicates (in reverse order) instead of the first.
+    workers : int, optional
+        Process pool size used for a ``ChunkedDataset``.
+    spill_rows : int | None, optional
+        Row hashes kept in memory before spilling to disk.  Defaults to
+        ``DUP_SPILL_ROWS``.
+    spill_dir : str | Path | None, optional
+        Directory for the temporary spill files (system temp by default).
+    hashes : np.ndarray | None, optional
+        Precomputed row hashes of the key columns of an in-memory ``data``,
+        as cached in its analysis profile.
+
+    Returns
+    -------
+    dict
+        ``total_rows``, ``duplicate_entries`` (rows in any duplicate group),
+        ``unique_duplicates`` (rows beyond the first of each group),
+        ``groups``, ``group_sizes`` (``{size: number_of_groups}``),
+        ``largest_group`` and ``sample_positions`` (row positions).
+    """
+    if subset:
+        missing = [c for c in subset if c not in data.columns]
+        if missing:
+            raise ValueError(f"Unknown duplicate key columns: {missing}")
+        subset = list(subset)
+    counter = _DuplicateCounter(num_rows, sort_desc, spill_rows, spill_dir)
+    if isinstance(data, ChunkedDataset):
+        if data._dtypes is None:
+            data.scan(workers)
+        dtypes = data.dtypes if not subset else data.dtypes[subset]
+        for hashes in data.map_parts(
+            _analysis_task,
+            "Duplicate Detection",
+            subset,
+            dtypes.to_dict(),
+            {},
+            workers=workers,
+        ):
+            counter.add(hashes)
+    else:
+        counter.add(_hash_partial(data, subset) if hashes is None else hashes)
+    return counter.finish()
+
+
+# Per-chunk ("map") step of each analysis that can run on chunks in parallel.
+_CHUNK_PARTIALS = {
+    "Missing Values": _missing_partial,
+    "Duplicate Detection": _hash_partial,
+    "Placeholder Detection": _placeholder_partial,
+    "Special Character Analysis": _special_partial,
+}
+
+
+# What each analysis needs from the frame it is handed by ``run_analysis``:
+#   ordered - reads rows in display order, so ``sort_desc`` applies to it
+#   mutable - modifies its input and must be given a private copy
+_ANALYSIS_NEEDS = {
+    "Data Preview": {"ordered": True, "mutable": False},
+    "Missing Values": {"ordered": False, "mutable": False},
+    "Duplicate Detection": {"ordered": True, "mutable": False},
+    "Placeholder Detection": {"ordered": False, "mutable": False},
+    "Special Character Analysis": {"ordered": False, "mutable": False},
+}
+
+
+def _ordered_positions(total: int, num_rows: int, sort_desc: bool) -> range:
+    """Positions of the first ``num_rows`` rows, or the last ones reversed."""
+    if sort_desc:
+        return range(total - 1, max(total - num_rows, 0) - 1, -1)
+    return range(min(num_rows, total))
+
+
+def _analysis_task(path, row_group, analysis_type, columns, dtypes, options=None):
+    """Process pool worker: read one chunk and compute its partial result."""
+    chunk = _read_part(path, row_group, columns, dtypes)
+    return _CHUNK_PARTIALS[analysis_type](chunk, **(options or {}))
+
+
+# ----------------------------------------------------------------------
+# Column profile cache
+# ----------------------------------------------------------------------
+# Profiles of loaded datasets, keyed by ``_dataset_key``.  Each entry is
+# dropped when its dataset is garbage collected.  The lock is re-entrant
+# because that can happen while the lock is held.
+_PROFILES = {}
+_PROFILES_LOCK = threading.RLock()
+
+
+def _dataset_key(paths, options=None) -> tuple:
+    """Identity of the files behind a dataset: resolved path, size, mtime.
+
+    ``options`` holds whatever else shapes the loaded data (reader settings,
+    column selection, filters) so differently loaded copies never collide.
+    """
+    files = []
+    for path in paths:
+        st = os.stat(path)
+        files.append((str(Path(path).resolve()), st.st_size, st.st_mtime_ns))
+    return (tuple(files), repr(options))
+
+
+class _Profile:
+    """Analysis results cached for one loaded dataset.
+
+    Per-column values (null counts, placeholder counts, special character
+    histograms) are stored column by column so analysing one column reuses
+    an earlier "All Columns" run and vice versa.  Row hashes and duplicate
+    statistics are stored by their key columns.  ``ref`` is a weak reference
+    to the dataset the profile was built for; frames derived from it share
+    its ``attrs`` but not its profile.
+    """
+
+    def __init__(self, data):
+        self.ref = weakref.ref(data)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def memo(self, key, compute):
+        if key not in self.values:
+            self.values[key] = compute()
+        return self.values[key]
+
+    def columns(self, name, columns, compute) -> dict:
+        store = self.values.setdefault(name, {})
+        todo = [c for c in columns if c not in store]
+        if todo:
+            store.update(compute(todo))
+        return {c: store[c] for c in columns}
+
+
+def _drop_profile(key, profile) -> None:
+    with _PROFILES_LOCK:
+        if _PROFILES.get(key) is profile:
+            del _PROFILES[key]
+
+
+def _new_profile(data, key) -> _Profile:
+    """Register a profile for ``data`` that lives only as long as ``data``."""
+    profile = _PROFILES[key] = _Profile(data)
+    weakref.finalize(data, _drop_profile, key, profile)
+    return profile
+
+
+def _profile_for(data) -> _Profile | None:
+    """Return the cached profile of ``data`` if it came from ``load_data``."""
+    key = data.attrs.get("profile_key")
+    if key is None:
+        return None
+    with _PROFILES_LOCK:
+        profile = _PROFILES.get(key)
+        if profile is None or profile.ref() is None:
+            profile = _new_profile(data, key)
+        elif profile.ref() is not data:
+            return None
+    return profile
+
+
+def _memo(profile, key, compute):
+    return compute() if profile is None else profile.memo(key, compute)
+
+
+def _memo_columns(profile, name, columns, compute) -> dict:
+    if profile is None:
+        return compute(list(columns))
+    return profile.columns(name, list(columns), compute)
+
+
+def clear_profile_cache(paths=None) -> None:
+    """Drop cached analysis profiles, all of them or those touching ``paths``.
+
+    ``paths`` may be a single path or a list of them.
+    """
+    with _PROFILES_LOCK:
+        if paths is None:
+            _PROFILES.clear()
+            return
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+        resolved = {str(Path(p).resolve()) for p in paths}
+        for key in [k for k in _PROFILES if any(f[0] in resolved for f in k[0])]:
+            del _PROFILES[key]
+
+
+def _stamp_profile_key(data, paths, options=None) -> None:
+    """Tag freshly loaded ``data`` with its identity and drop stale profiles."""
+    clear_profile_cache(paths)
+    key = _dataset_key(paths, options)
+    data.attrs["profile_key"] = key
+    with _PROFILES_LOCK:
+        _new_profile(data, key)
+
+
+def _placeholder_key(placeholders) -> tuple:
+    tokens = PLACEHOLDERS if placeholders is None else placeholders
+    return ("placeholders", frozenset(tokens))
+
+
+def _run_analysis_chunked(
+    ds: ChunkedDataset,
+    analysis_type: str,
+    column: str = None,
+    num_rows: int = 10,
+    sort_desc: bool = False,
+    workers: int = 0,
+    placeholders=None,
+    subset=None,
+) -> str:
+    """Chunk-by-chunk counterpart of ``run_analysis`` for ``ChunkedDataset``.
+
+    Each chunk's partial result is computed by ``_analysis_task`` (in a
+    process pool when ``workers`` > 1) and merged here in chunk order.
+    """
+    if ds._dtypes is None:
+        ds.scan(workers)
+    columns = [column] if column and column in ds.columns else None
+    dtypes = ds.dtypes if columns is None else ds.dtypes[columns]
+    total = len(ds)
+    profile = _profile_for(ds)
+
+    if analysis_type == "Data Preview":
+        positions = _ordered_positions(total, num_rows, sort_desc)
+        return _format_preview(dtypes, ds.take(positions, columns))
+
+    if analysis_type == "Duplicate Detection":
+        keys = list(subset or columns or ds.columns)
+        stats = _memo(
+            profile,
+            ("duplicates", tuple(keys), num_rows, sort_desc),
+            lambda: find_duplicates(ds, keys, num_rows, sort_desc, workers=workers),
+        )
+        sample = (
+            ds.take(stats["sample_positions"], columns)
+            if stats["duplicate_entries"]
+            else None
+        )
+        return _format_duplicates(stats, sample)
+
+    if analysis_type not in _CHUNK_PARTIALS:
+        return f"[Notice] {analysis_type} not recognized."
+
+    options = {}
+    if analysis_type == "Placeholder Detection" and placeholders is not None:
+        options["placeholders"] = set(placeholders)
+
+    def merged(todo):
+        partials = ds.map_parts(
+            _analysis_task,
+            analysis_type,
+            todo,
+            ds.dtypes[todo].to_dict(),
+            options,
+            workers=workers,
+        )
+        result = {}
+        for part in partials:
+            if analysis_type == "Special Character Analysis":
+                _merge_special(result, part)
+            else:
+                _merge_counts(result, dict(part))
+        return result
+
+    if analysis_type == "Missing Values":
+        miss = _memo_columns(profile, "missing", dtypes.index, merged)
+        return _format_missing(miss, total)
+
+    if analysis_type == "Placeholder Detection":
+        key = _placeholder_key(placeholders)
+        counts = _memo_columns(profile, key, dtypes.index, merged)
+        return _format_placeholders(counts, total)
+
+    stats = _memo_columns(profile, "special", dtypes.index, merged)
+    return _format_special(stats)
+
+
 def run_analysis(
     df: pd.DataFrame,
     analysis_type: str,
     column: str = None,
     num_rows: int = 10,
     sort_desc: bool = False,
+    workers: int = 0,
+    placeholders=None,
+    subset=None,
 ) -> str:
     """
     Dispatch to one of:
@@ -464,83 +2431,338 @@ def run_analysis(
       - Placeholder Detection
       - Special Character Analysis
     Returns a formatted string.
+
+    ``df`` may also be a ``ChunkedDataset``, in which case the analysis is
+    computed chunk by chunk without loading the whole dataset.  ``workers``
+    then sets the size of the process pool the chunks are spread across.
+
+    ``placeholders`` replaces the default ``PLACEHOLDERS`` tokens used by
+    Placeholder Detection.  ``subset`` names the key columns Duplicate
+    Detection compares (see ``find_duplicates``); by default rows are
+    compared on the analysed columns.
+
+    ``df`` is analysed in place and never copied.  ``sort_desc`` only
+    affects the order-dependent analyses (Data Preview and the Duplicate
+    Detection sample); see ``_ANALYSIS_NEEDS``.
     """
-    # subset + sort
-    working = df[[column]] if column and column in df.columns else df.copy()
-    if sort_desc:
-        working = working.iloc[::-1]
+    if isinstance(df, ChunkedDataset):
+        return _run_analysis_chunked(
+            df,
+            analysis_type,
+            column,
+            num_rows,
+            sort_desc,
+            workers,
+            placeholders,
+            subset,
+        )
+
+    needs = _ANALYSIS_NEEDS.get(analysis_type)
+    if needs is None:
+        return f"[Notice] {analysis_type} not recognized."
+
+    # The full frame is only duplicated for an analysis that declares it
+    # mutates its input.
+    working = df[[column]] if column and column in df.columns else df
+    if needs["mutable"]:
+        working = working.copy()
+    # Unordered analyses give the same answer either way, so ``sort_desc``
+    # only reaches the ones that read rows in display order.
+    sort_desc = sort_desc and needs["ordered"]
 
     if analysis_type == "Data Preview":
-        preview = working.head(num_rows)
-        dtypes = [(c, str(t)) for c, t in working.dtypes.items()]
-        return (
-            "[Data Types]\n"
-            + tabulate(dtypes, headers=["Column", "Dtype"], tablefmt="fancy_grid")
-            + "\n\n[Preview]\n"
-            + tabulate(preview, headers="keys", tablefmt="fancy_grid")
-        )
+        positions = _ordered_positions(len(working), num_rows, sort_desc)
+        return _format_preview(working.dtypes, working.iloc[positions])
+
+    profile = _profile_for(df)
 
     if analysis_type == "Missing Values":
-        miss = working.isnull().sum()
-        total = len(working)
-        rows = [
-            (c, int(cnt), f"{cnt/total*100:.2f}%") for c, cnt in miss.items() if cnt > 0
-        ]
-        if not rows:
-            return "No missing values detected."
-        return (
-            "=== Missing Values ===\n"
-            + tabulate(rows, headers=["Column", "Count", "%"], tablefmt="fancy_grid")
-            + f"\n\nTotal rows: {total}"
+        miss = _memo_columns(
+            profile,
+            "missing",
+            working.columns,
+            lambda todo: dict(_missing_partial(_select_columns(working, todo))),
         )
+        return _format_missing(miss, len(working))
 
     if analysis_type == "Duplicate Detection":
-        dups = working[working.duplicated(keep=False)]
-        if dups.empty:
-            return f"No duplicates. Checked {len(working)} rows."
-        unique = working[working.duplicated()]
-        report = [
-            ["Total Rows", len(working)],
-            ["Duplicate entries", len(dups)],
-            ["Unique duplicate rows", len(unique)],
-        ]
-        body = tabulate(dups.head(num_rows), headers="keys", tablefmt="fancy_grid")
-        return (
-            "🔍 Duplicate Report\n"
-            + tabulate(report, headers=["Metric", "Value"], tablefmt="fancy_grid")
-            + "\n\n"
-            + body
+        keys = list(subset or working.columns)
+        hashes = _memo(
+            profile, ("hashes", tuple(keys)), lambda: _hash_partial(df, keys)
+        )
+        stats = _memo(
+            profile,
+            ("duplicates", tuple(keys), num_rows, sort_desc),
+            lambda: find_duplicates(df, keys, num_rows, sort_desc, hashes=hashes),
         )
+        sample = (
+            working.iloc[stats["sample_positions"]]
+            if stats["duplicate_entries"]
+            else None
+        )
+        return _format_duplicates(stats, sample)
 
     if analysis_type == "Placeholder Detection":
-        rec = []
-        total = len(working)
-        for c in working.columns:
-            col_ser = working[c].astype(str).str.strip()
-            cnt = col_ser.isin(PLACEHOLDERS).sum()
-            if cnt > 0:
-                rec.append([c, cnt, f"{cnt/total*100:.2f}%"])
-        if not rec:
-            return "No placeholders found."
-        return tabulate(rec, headers=["Column", "Count", "%"], tablefmt="fancy_grid")
-
-    if analysis_type == "Special Character Analysis":
-        pat = r"[^\w\s]"
-        rec = []
-        for c in working.columns:
-            ser = working[c].astype(str)
-            mask = ser.str.contains(pat, regex=True)
-            cnt = int(mask.sum())
-            if cnt:
-                chars = set("".join(ser[mask]))
-                rec.append([c, cnt, "".join(sorted(chars))])
-        if not rec:
-            return "No special characters found."
-        return tabulate(
-            rec, headers=["Column", "Count", "Chars"], tablefmt="fancy_grid"
+        counts = _memo_columns(
+            profile,
+            _placeholder_key(placeholders),
+            working.columns,
+            lambda todo: _placeholder_partial(
+                _select_columns(working, todo), placeholders
+            ),
         )
+        return _format_placeholders(counts, len(working))
+
+    stats = _memo_columns(
+        profile,
+        "special",
+        working.columns,
+        lambda todo: _special_partial(_select_columns(working, todo)),
+    )
+    return _format_special(stats)
+
 
-    return f"[Notice] {analysis_type} not recognized."
+_WORD = re.compile(r"\w+")
+
+
+def _tokenize(text: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Split text into ``\\w+`` words as ``(position, word)`` pairs.
+
+    With pyarrow the split runs vectorized in Arrow, using the Unicode
+    classes that make up Python's ``\\w`` (letters, numbers, underscore).
+    """
+    if pa is not None:
+        import pyarrow.compute as pc
+
+        arr = pa.array(
+            text.to_numpy(dtype=object), type=pa.large_string(), from_pandas=True
+        )
+        parts = pc.split_pattern_regex(arr, r"[^\p{L}\p{N}_]+")
+        words = pc.list_flatten(parts)
+        parents = pc.list_parent_indices(parts)
+        keep = pc.not_equal(words, "")
+        return (
+            parents.filter(keep).to_numpy(),
+            words.filter(keep).to_numpy(zero_copy_only=False),
+        )
+    words = text.str.findall(_WORD).explode()
+    words = words[words.notna()]
+    return words.index.to_numpy(), words.to_numpy()
+
+
+class _TokenIndex:
+    """Inverted index of one column: lower-cased word tokens to row positions.
+
+    Tokens are the ``\\w+`` runs of each cell's text, i.e. exactly the
+    words ``\\b`` delimits, so a token lookup answers a whole-word query.
+    Only the column's distinct values are stringified and tokenized; their
+    tokens are then expanded to the rows holding each value.  ``vocab`` is
+    sorted, so a prefix query is a contiguous range of it.  Row positions
+    are stored as ``int32`` whenever the column is short enough.
+    """
+
+    def __init__(self, ser: pd.Series):
+        pos_dtype = np.int32 if len(ser) < 2**31 else np.int64
+        codes, uniques = pd.factorize(ser)
+        uid, token = _tokenize(pd.Series(uniques).astype(str).str.lower())
+        tok, vocab = pd.factorize(token, sort=True)
+        # Distinct (value, token) pairs, packed into one integer key.
+        width = max(len(vocab), 1)
+        pairs = np.sort(uid.astype(np.int64) * width + tok)
+        pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]]
+        uid, tok = pairs // width, pairs % width
+
+        # Rows grouped by distinct value, then expanded per (value, token).
+        valid = np.flatnonzero(codes >= 0).astype(pos_dtype)
+        by_value = valid[np.argsort(codes[valid], kind="stable")]
+        counts = np.bincount(codes[valid], minlength=len(uniques))
+        starts = np.cumsum(counts) - counts
+        n = counts[uid]
+        pair_of = np.repeat(np.arange(len(uid)), n)
+        within = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        rows = by_value[starts[uid][pair_of] + within]
+        toks = tok[pair_of]
+        order = np.lexsort((rows, toks))
+
+        self.vocab = list(vocab)
+        self.rows = rows[order]
+        self.offsets = np.searchsorted(toks[order], np.arange(len(self.vocab) + 1))
+
+    def lookup(self, token: str, prefix: bool = False) -> np.ndarray:
+        """Sorted row positions whose cells contain ``token`` (or a prefix)."""
+        lo = bisect.bisect_left(self.vocab, token)
+        if prefix:
+            hi = bisect.bisect_left(self.vocab, token + "\U0010ffff")
+            return np.unique(self.rows[self.offsets[lo] : self.offsets[hi]])
+        if lo < len(self.vocab) and self.vocab[lo] == token:
+            return self.rows[self.offsets[lo] : self.offsets[lo + 1]]
+        return np.empty(0, dtype=self.rows.dtype)
+
+
+def _is_text(ser: pd.Series) -> bool:
+    """Whether ``ser`` holds text worth a token index (object or string)."""
+    dtype = ser.dtype
+    return dtype == object or pd.api.types.is_string_dtype(dtype)
+
+
+def build_search_index(df: pd.DataFrame, column: str | None = None) -> bool:
+    """Build the token index ``search_dataframe`` uses for word queries.
+
+    The index lives in the dataset's analysis profile, so only frames
+    returned by ``load_data`` can be indexed.  Only text (object or string)
+    columns are indexed; word queries scan numeric columns directly.  Each
+    column's index is built lazily by the first whole-word or prefix search
+    that touches it, or ahead of time by calling this.  An index takes
+    roughly as much memory as the column it covers.
+
+    Returns ``True`` when the dataset can use an index.
+    """
+    profile = _profile_for(df) if isinstance(df, pd.DataFrame) else None
+    if profile is None:
+        return False
+    columns = [column] if column and column in df.columns else list(df.columns)
+    columns = [c for c in columns if _is_text(df[c])]
+    with profile.lock:
+        profile.columns(
+            "search_index",
+            columns,
+            lambda todo: {c: _TokenIndex(df[c]) for c in todo},
+        )
+    return True
+
+
+def _index_candidates(
+    df: pd.DataFrame, column: str | None, term: str, prefix: bool
+) -> np.ndarray | None:
+    """Row positions that may match a whole-word/prefix query, via the index.
+
+    ``term`` is literal, so each of its words is delimited either by the
+    term's own non-word characters or by the ``\\b`` around it; every word
+    must therefore occur as a token of the matching cell (the last one only
+    as a prefix in prefix mode when the term ends in a word character).
+    Intersecting their row sets per column and taking the union across
+    columns gives a superset of the matches.  Columns without an index
+    (numeric ones) are matched case-insensitively by a scan instead.
+    Returns ``None`` when the index cannot answer the query.
+    """
+    words = _WORD.findall(term.lower())
+    if not words or not build_search_index(df, column):
+        return None
+    last_prefix = prefix and _WORD.match(term[-1]) is not None
+    columns = [column] if column and column in df.columns else list(df.columns)
+    indexes = _profile_for(df).values.get("search_index", {})
+    mode = "prefix" if prefix else "whole"
+    found = []
+    for c in columns:
+        if c not in indexes:
+            mask = _search_mask(df[[c]], term, False, mode)
+            found.append(np.flatnonzero(mask.to_numpy()))
+            continue
+        rows = None
+        for i, word in enumerate(words):
+            hit = indexes[c].lookup(word, last_prefix and i == len(words) - 1)
+            rows = hit if rows is None else np.intersect1d(rows, hit, assume_unique=True)
+        found.append(rows)
+    return np.unique(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+
+# Search modes accepted by ``search_dataframe``.
+#   literal - plain substring, no regex engine involved (default)
+#   whole   - the literal term as whole words
+#   prefix  - the literal term at the start of a word
+#   regex   - ``term`` is a regular expression
+SEARCH_MODES = ("literal", "whole", "prefix", "regex")
+
+
+def _search_pattern(term: str, mode: str) -> str:
+    if mode == "whole":
+        return rf"\b{re.escape(term)}\b"
+    if mode == "prefix":
+        return rf"\b{re.escape(term)}"
+    return term
+
+
+def _column_text(
+    df: pd.DataFrame, columns, lower: bool = False, workers: int = 0
+) -> dict:
+    """Text form of ``columns`` (lower-cased if ``lower``).
+
+    Only the lower-cased form, used by the default case-insensitive literal
+    search, is cached: for a loaded dataset it is kept per column in the
+    analysis profile so repeated searches skip re-converting every cell.
+    That costs one extra string copy of each searched column for as long
+    as the dataset lives (``clear_profile_cache`` releases it).  The as-is
+    text for other modes is rebuilt on every search.
+    """
+    profile = _profile_for(df) if lower else None
+
+    def one(c):
+        text = df[c].astype(str)
+        return text.str.lower() if lower else text
+
+    def convert(todo):
+        if workers and workers > 1 and len(todo) > 1:
+            with ThreadPoolExecutor(min(workers, len(todo))) as pool:
+                return dict(zip(todo, pool.map(one, todo)))
+        return {c: one(c) for c in todo}
+
+    return _memo_columns(profile, "lower", columns, convert)
+
+
+def _search_mask(
+    data: pd.DataFrame,
+    term: str,
+    case: bool = False,
+    mode: str = "literal",
+    texts: dict | None = None,
+    workers: int = 0,
+) -> pd.Series:
+    """Boolean mask of the rows of ``data`` where any column matches.
+
+    ``texts`` may supply the (cached) text form of the columns: lower-cased
+    for a case-insensitive literal search, as is otherwise.  With
+    ``workers`` greater than one the columns are matched on a thread pool;
+    Arrow-backed string kernels release the GIL, so they run in parallel.
+    """
+    lower = mode == "literal" and not case
+    if texts is None:
+        texts = _column_text(data, data.columns, lower)
+    mask = _texts_mask(texts, len(data), term, case, mode, workers)
+    return pd.Series(mask, index=data.index)
+
+
+def _texts_mask(
+    texts: dict, nrows: int, term: str, case: bool, mode: str, workers: int = 0
+) -> np.ndarray:
+    """Match the text columns in ``texts`` and OR their hits row-wise."""
+    if mode == "literal":
+        needle = term if case else term.lower()
+        match = partial(_contains, pat=needle, case=True, regex=False)
+    else:
+        match = partial(
+            _contains, pat=_search_pattern(term, mode), case=case, regex=True
+        )
+    if workers and workers > 1 and len(texts) > 1:
+        with ThreadPoolExecutor(min(workers, len(texts))) as pool:
+            hits = list(pool.map(match, texts.values()))
+    else:
+        hits = map(match, texts.values())
+    mask = np.zeros(nrows, dtype=bool)
+    for hit in hits:
+        mask |= hit
+    return mask
+
+
+def _contains(text: pd.Series, pat: str, case: bool, regex: bool) -> np.ndarray:
+    hit = text.str.contains(pat, case=case, regex=regex, na=False)
+    return hit.to_numpy(dtype=bool)
+
+
+def _search_task(path, row_group, columns, dtypes, term, case, mode):
+    """Process pool worker: search one chunk, returning its size and hits."""
+    chunk = _read_part(path, row_group, columns, dtypes)
+    mask = _search_mask(chunk, term, case, mode)
+    return len(chunk), np.flatnonzero(mask.to_numpy())
 
 
 def search_dataframe(
@@ -549,13 +2771,17 @@ def search_dataframe(
     column: str | None = None,
     case: bool = False,
     whole: bool = False,
+    prefix: bool = False,
+    use_index: bool = True,
+    mode: str | None = None,
+    workers: int = 0,
 ) -> list[int]:
     """Return indices of rows containing ``term``.
 
     Parameters
     ----------
     df : pd.DataFrame
-        DataFrame to search.
+        DataFrame to search. A ``ChunkedDataset`` is searched chunk by chunk.
     term : str
         Search term.
     column : str | None, optional
@@ -563,29 +2789,74 @@ def search_dataframe(
     case : bool, optional
         Perform case-sensitive matching.
     whole : bool, optional
-        Match whole words only when ``True``.
+        Shorthand for ``mode="whole"``.
+    prefix : bool, optional
+        Shorthand for ``mode="prefix"``.
+    use_index : bool, optional
+        Answer whole-word and prefix queries from the token index of a
+        loaded DataFrame (see ``build_search_index``), only rescanning the
+        candidate rows when the index alone is not exact.
+    mode : str | None, optional
+        One of ``SEARCH_MODES``.  Defaults to ``"literal"`` unless ``whole``
+        or ``prefix`` is set.  Only ``"regex"`` treats ``term`` as a
+        pattern; the other modes match it literally.
+    workers : int, optional
+        Search in parallel when greater than one: the columns of a
+        DataFrame on a thread pool, the chunks of a ``ChunkedDataset`` on a
+        process pool.  The result is the same sorted list either way.
 
     Returns
     -------
     list[int]
         List of row indices with matches.
     """
-
-    if column and column in df.columns:
-        data = df[[column]]
+    if mode is None:
+        mode = "whole" if whole else "prefix" if prefix else "literal"
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode: {mode}")
+
+    if isinstance(df, ChunkedDataset):
+        columns = [column] if column and column in df.columns else None
+        dtypes = df.dtypes if columns is None else df.dtypes[columns]
+        matches = []
+        offset = 0
+        for nrows, hits in df.map_parts(
+            _search_task,
+            columns,
+            dtypes.to_dict(),
+            term,
+            case,
+            mode,
+            workers=workers,
+        ):
+            matches.extend((hits + offset).tolist())
+            offset += nrows
     else:
-        data = df
-
-    pattern = rf"\b{term}\b" if whole else term
-    mask = data.apply(
-        lambda s: s.astype(str).str.contains(pattern, case=case, regex=True)
-    ).any(axis=1)
-    matches = mask[mask].index.tolist()
+        if column and column in df.columns:
+            data = df[[column]]
+        else:
+            data = df
+
+        candidates = None
+        if use_index and mode in {"whole", "prefix"}:
+            candidates = _index_candidates(df, column, term, mode == "prefix")
+        if candidates is None:
+            lower = mode == "literal" and not case
+            texts = _column_text(df, data.columns, lower, workers)
+            mask = _search_mask(data, term, case, mode, texts, workers)
+            matches = mask[mask].index.tolist()
+        elif case or not _WORD.fullmatch(term):
+            subset = data.iloc[candidates]
+            mask = _search_mask(subset, term, case, mode)
+            matches = mask[mask].index.tolist()
+        else:
+            matches = data.index[candidates].tolist()
 
     logger.info(
-        "Search performed: term=%s column=%s matches=%s",
+        "Search performed: term=%s column=%s mode=%s matches=%s",
         term,
         column or "ALL",
+        mode,
         len(matches),
     )
     print(
@@ -594,20 +2865,639 @@ def search_dataframe(
     return matches
 
 
-def export_dataframe(df: pd.DataFrame, path: str, fmt: str = "csv") -> Path:
-    """Export a DataFrame to CSV or Excel."""
+class SearchSession:
+    """Search-as-you-type over one dataset.
+
+    Each call to ``search`` supersedes the previous one: a search still
+    running on another thread notices at its next row block and gives up,
+    returning ``None``.  When the new term extends the previous one in a
+    way that can only remove matches (a longer literal substring, or a
+    longer prefix) only the previous matches are rescanned.  ``on_partial``
+    receives the first ``first_n`` matches as soon as they are found, before
+    the rest of the rows have been scanned.
+
+    Parameters
+    ----------
+    df : pd.DataFrame | ChunkedDataset
+        Dataset to search.
+    column, case, mode, workers :
+        As for ``search_dataframe``; fixed for the life of the session.
+    block_rows : int, optional
+        Rows scanned between checks for cancellation and partial results.
+    """
+
+    def __init__(
+        self,
+        df,
+        column: str | None = None,
+        case: bool = False,
+        mode: str = "literal",
+        workers: int = 0,
+        block_rows: int = 100_000,
+    ):
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
+        self.df = df
+        self.column = column if column and column in df.columns else None
+        self.case = case
+        self.mode = mode
+        self.workers = workers
+        self.block_rows = max(1, int(block_rows))
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._term = None
+        self._positions = None
+        self._texts = None
+
+    def cancel(self) -> None:
+        """Abandon any search in flight."""
+        with self._lock:
+            self._generation += 1
+
+    def _narrows(self, previous: str | None, term: str) -> bool:
+        """Whether every match of ``term`` is also a match of ``previous``."""
+        if not previous:
+            return False
+        if not self.case:
+            previous, term = previous.lower(), term.lower()
+        if self.mode == "literal":
+            return previous in term
+        if self.mode == "prefix":
+            return term.startswith(previous)
+        return previous == term
+
+    def search(self, term: str, first_n: int | None = None, on_partial=None):
+        """Return the indices of rows matching ``term``, or ``None`` if stale.
+
+        ``on_partial`` is called with a list of the first ``first_n`` row
+        indices as soon as that many matches have been found.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            previous, positions = self._term, self._positions
+        if not term:
+            return []
+
+        if previous == term and positions is not None:
+            found = positions
+        else:
+            if not self._narrows(previous, term):
+                positions = None
+            found = self._scan(term, positions, generation, first_n, on_partial)
+            if found is None:
+                logger.debug("Search for %r superseded", term)
+                return None
+
+        with self._lock:
+            if generation != self._generation:
+                return None
+            self._term, self._positions = term, found
+        return self._labels(found)
+
+    def _labels(self, positions) -> list[int]:
+        if isinstance(self.df, ChunkedDataset):
+            return positions.tolist()
+        return self.df.index[positions].tolist()
+
+    def _blocks(self, candidates):
+        """Yield ``(row_positions, texts)`` blocks of the rows to scan."""
+        columns = [self.column] if self.column else list(self.df.columns)
+        lower = self.mode == "literal" and not self.case
+        if isinstance(self.df, ChunkedDataset):
+            if candidates is None:
+                frames = self.df.iter_chunks(columns)
+            else:
+                frames = (
+                    self.df.take(candidates[i : i + self.block_rows], columns)
+                    for i in range(0, len(candidates), self.block_rows)
+                )
+            for frame in frames:
+                yield frame.index.to_numpy(), _column_text(frame, columns, lower)
+            return
+
+        if self._texts is None:
+            self._texts = _column_text(self.df, columns, lower, self.workers)
+        texts = self._texts
+        total = len(self.df) if candidates is None else len(candidates)
+        for start in range(0, total, self.block_rows):
+            stop = start + self.block_rows
+            if candidates is None:
+                rows = np.arange(start, min(stop, total))
+                yield rows, {c: t.iloc[start:stop] for c, t in texts.items()}
+            else:
+                rows = candidates[start:stop]
+                yield rows, {c: t.iloc[rows] for c, t in texts.items()}
+
+    def _scan(self, term, candidates, generation, first_n, on_partial):
+        if (
+            candidates is None
+            and self.mode in {"whole", "prefix"}
+            and isinstance(self.df, pd.DataFrame)
+        ):
+            candidates = _index_candidates(
+                self.df, self.column, term, self.mode == "prefix"
+            )
+            if candidates is not None and not self.case and _WORD.fullmatch(term):
+                return candidates
+
+        found = []
+        count = 0
+        notified = not (on_partial and first_n)
+        for rows, texts in self._blocks(candidates):
+            if self._generation != generation:
+                return None
+            mask = _texts_mask(texts, len(rows), term, self.case, self.mode, self.workers)
+            hits = rows[mask]
+            found.append(hits)
+            count += len(hits)
+            if not notified and count >= first_n:
+                notified = True
+                on_partial(self._labels(np.concatenate(found)[:first_n]))
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(found)
+
+
+# ----------------------------------------------------------------------
+# Query engine
+# ----------------------------------------------------------------------
+_QUERY_TOKEN_RE = re.compile(r'(?:[^\s"]+|"[^"]*")+')
+_QUERY_COLUMN_RE = re.compile(r'^(?:"([^"]*)"|([^":]+)):(.+)$')
+_NUMBER = r"-?\d+(?:\.\d+)?"
+_RANGE_RE = re.compile(rf"({_NUMBER})?\.\.({_NUMBER})?")
+_COMPARE_RE = re.compile(rf"(>=|<=|>|<)({_NUMBER})")
+_FUZZY_RE = re.compile(r"(.+?)~(\d)?")
+
+
+def _unquote(text: str) -> str:
+    return text.replace('"', "")
+
+
+def _parse_clause(token: str) -> tuple:
+    """Parse one query token into a ``(kind, column, value)`` clause."""
+    column = None
+    body = token
+    match = _QUERY_COLUMN_RE.match(token)
+    if match:
+        column = match.group(1) if match.group(1) is not None else match.group(2)
+        body = match.group(3)
+
+    if column is not None:
+        ranged = _RANGE_RE.fullmatch(body)
+        if ranged and any(ranged.groups()):
+            low, high = (float(v) if v else None for v in ranged.groups())
+            return ("range", column, (low, high, True, True))
+        compared = _COMPARE_RE.fullmatch(body)
+        if compared:
+            op, number = compared.group(1), float(compared.group(2))
+            if op.startswith(">"):
+                return ("range", column, (number, None, op == ">=", True))
+            return ("range", column, (None, number, True, op == "<="))
+
+    fuzzy = _FUZZY_RE.fullmatch(body)
+    if fuzzy and not body.startswith('"'):
+        word = _unquote(fuzzy.group(1))
+        if not _WORD.fullmatch(word):
+            raise ValueError(f"Fuzzy terms must be a single word: {token!r}")
+        return ("fuzzy", column, (word.lower(), int(fuzzy.group(2) or 1)))
+    return ("text", column, _unquote(body))
+
+
+def parse_query(text: str) -> list[list[tuple]]:
+    """Parse a search query into OR-ed groups of AND-ed clauses.
+
+    Whitespace separated clauses must all match (``AND`` may be written
+    out); ``OR`` starts a new group.  A clause is one of:
+
+    - ``term`` or ``"a phrase"`` - literal text in any column
+    - ``col:term`` / ``"col name":"a phrase"`` - literal text in one column
+    - ``col:10..20``, ``col:10..``, ``col:>=5``, ``col:<3`` - numeric range
+    - ``term~`` / ``col:term~2`` - a word within edit distance 1 (or 2)
+
+    Examples
+    --------
+    >>> parse_query("city:york amount:>=100 OR smith~")
+    [[('text', 'city', 'york'), ('range', 'amount', (100.0, None, True, True))],
+     [('fuzzy', None, ('smith', 1))]]
+    """
+    groups = [[]]
+    for token in _QUERY_TOKEN_RE.findall(text):
+        if token == "OR":
+            groups.append([])
+        elif token != "AND":
+            groups[-1].append(_parse_clause(token))
+    groups = [g for g in groups if g]
+    if not groups:
+        raise ValueError("Empty query")
+    return groups
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """Whether the Levenshtein distance between ``a`` and ``b`` is <= ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+def _clause_cost(clause: tuple) -> tuple:
+    """Order clauses so cheap, selective ones narrow the rows first.
+
+    Numeric ranges are a single vectorized comparison, one-column text is
+    cheaper than scanning every column, fuzzy matching is the most costly;
+    among text clauses longer terms tend to match fewer rows.
+    """
+    kind, column, value = clause
+    if kind == "range":
+        return (0, 0)
+    if kind == "text":
+        return (1 if column else 2, -len(value))
+    return (3, -len(value[0]))
+
+
+def _clause_hits(df: pd.DataFrame, clause: tuple, rows, case: bool, workers: int):
+    """Positions among ``rows`` (all rows if ``None``) matching ``clause``."""
+    kind, column, value = clause
+    columns = [column] if column else list(df.columns)
+    positions = np.arange(len(df)) if rows is None else rows
+
+    if kind == "range":
+        low, high, low_incl, high_incl = value
+        numbers = pd.to_numeric(df[column], errors="coerce")
+        numbers = numbers.to_numpy(dtype=float, na_value=np.nan)[positions]
+        keep = ~np.isnan(numbers)
+        if low is not None:
+            keep &= numbers >= low if low_incl else numbers > low
+        if high is not None:
+            keep &= numbers <= high if high_incl else numbers < high
+        return positions[keep]
+
+    if kind == "text":
+        lower = not case
+        texts = _column_text(df, columns, lower, workers)
+        if rows is not None:
+            texts = {c: t.iloc[rows] for c, t in texts.items()}
+        mask = _texts_mask(texts, len(positions), value, case, "literal", workers)
+        return positions[mask]
+
+    word, limit = value
+    found = []
+    for c in columns:
+        if rows is None and build_search_index(df, c) and _is_text(df[c]):
+            index = _profile_for(df).values["search_index"][c]
+            base = None
+        else:
+            index = _TokenIndex(df[c].iloc[positions])
+            base = positions
+        for i, token in enumerate(index.vocab):
+            if _within_distance(word, token, limit):
+                hit = index.rows[index.offsets[i] : index.offsets[i + 1]]
+                found.append(hit if base is None else base[hit])
+    if not found:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(found))
+
+
+def _resolve_clause(df, clause: tuple) -> tuple:
+    """Check a clause's column against ``df``.
+
+    A text clause naming an unknown column is taken as plain text instead,
+    so terms such as ``12:30`` or ``http://host`` still search normally.
+    """
+    kind, column, value = clause
+    if column is None or column in df.columns:
+        return clause
+    if kind == "text":
+        return ("text", None, f"{column}:{value}")
+    raise ValueError(f"Unknown column in query: {column!r}")
+
+
+def _query_positions(df: pd.DataFrame, groups, case: bool, workers: int) -> np.ndarray:
+    """Evaluate parsed ``groups`` on ``df``, returning sorted row positions.
+
+    Within a group the clauses run cheapest first, each only over the rows
+    that survived the previous ones, and the group stops as soon as no row
+    is left.  Rows already matched by an earlier group are not rechecked.
+    """
+    matched = np.zeros(len(df), dtype=bool)
+    for group in groups:
+        rows = None if not matched.any() else np.flatnonzero(~matched)
+        for clause in sorted(group, key=_clause_cost):
+            rows = _clause_hits(df, clause, rows, case, workers)
+            if not len(rows):
+                break
+        matched[rows] = True
+    return np.flatnonzero(matched)
+
+
+def _query_task(path, row_group, dtypes, groups, case):
+    """Process pool worker: evaluate a query on one chunk."""
+    chunk = _read_part(path, row_group, None, dtypes)
+    return len(chunk), _query_positions(chunk, groups, case, 0)
+
+
+def query_dataframe(df, query, case: bool = False, workers: int = 0) -> list[int]:
+    """Return indices of rows matching a multi-clause ``query``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame | ChunkedDataset
+        Data to search.  A ``ChunkedDataset`` is queried chunk by chunk, in
+        a process pool when ``workers`` > 1.
+    query : str | list[list[tuple]]
+        Query text (see ``parse_query``) or its parsed form.
+    case : bool, optional
+        Case-sensitive text clauses.  Fuzzy clauses always ignore case.
+    workers : int, optional
+        Thread pool size for per-column matching of a DataFrame, or process
+        pool size for the chunks of a ``ChunkedDataset``.
+
+    Returns
+    -------
+    list[int]
+        Sorted row indices matching any group of the query.
+    """
+    groups = parse_query(query) if isinstance(query, str) else query
+    groups = [[_resolve_clause(df, c) for c in group] for group in groups]
+    if isinstance(df, ChunkedDataset):
+        matches = []
+        offset = 0
+        for nrows, hits in df.map_parts(
+            _query_task, df.dtypes.to_dict(), groups, case, workers=workers
+        ):
+            matches.extend((hits + offset).tolist())
+            offset += nrows
+    else:
+        matches = df.index[_query_positions(df, groups, case, workers)].tolist()
+
+    logger.info("Query performed: %s matches=%s", query, len(matches))
+    print(f"[Data Handler] Query '{query}' -> {len(matches)} matches")
+    return matches
+
+
+# Excel's row limit per worksheet, header row included.
+XLSX_MAX_ROWS = 1_048_576
+# How ``_write_xlsx`` spreads data beyond ``XLSX_MAX_ROWS``.
+XLSX_SPLIT_MODES = ("sheets", "files")
+
+
+def _xlsx_part_path(out_path: Path, part: int) -> Path:
+    """``data.xlsx`` for the first file, then ``data_2.xlsx``, ``data_3.xlsx``..."""
+    if part == 1:
+        return out_path
+    return out_path.with_name(f"{out_path.stem}_{part}{out_path.suffix}")
+
+
+def _write_xlsx(
+    blocks,
+    out_path,
+    columns,
+    total: int,
+    progress_fn=None,
+    split: str = "sheets",
+    max_rows: int | None = None,
+) -> list[Path]:
+    """Stream DataFrame ``blocks`` into xlsx with openpyxl's write-only mode.
+
+    Rows go straight to the worksheet's temporary XML stream, so memory
+    stays at one block regardless of the output size.  Whenever a sheet
+    reaches ``max_rows`` (``XLSX_MAX_ROWS`` by default) the remaining rows
+    continue on ``Sheet2``, ``Sheet3``... or, with ``split="files"``, in
+    ``<name>_2.xlsx``, ``<name>_3.xlsx``...  Every sheet repeats the header.
+
+    Returns the paths of the files written.
+    """
+    from openpyxl import Workbook
+
+    if split not in XLSX_SPLIT_MODES:
+        raise ValueError(f"split must be one of {XLSX_SPLIT_MODES}")
+    out_path = Path(out_path)
+    per_sheet = (max_rows or XLSX_MAX_ROWS) - 1
+    header = [str(c) for c in columns]
+    paths = []
+    book = None
+    sheet = None
+    sheet_rows = per_sheet
+    sheets = 0
+    done = 0
+
+    def next_sheet():
+        nonlocal book, sheet, sheets, sheet_rows
+        if book is not None and split == "files":
+            book.save(paths[-1])
+            book = None
+        if book is None:
+            book = Workbook(write_only=True)
+            paths.append(_xlsx_part_path(out_path, len(paths) + 1))
+            sheets = 0
+        sheets += 1
+        sheet = book.create_sheet(title=f"Sheet{sheets}")
+        sheet.append(header)
+        sheet_rows = 0
+
+    for block in blocks:
+        values = block.astype(object).where(block.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if sheet_rows == per_sheet:
+                next_sheet()
+            sheet.append(row)
+            sheet_rows += 1
+        done += len(block)
+        if progress_fn:
+            progress_fn(min(done / total * 100, 99) if total else 99, "Writing xlsx")
+    if book is None:
+        next_sheet()
+    book.save(paths[-1])
+    if len(paths) > 1 or sheets > 1:
+        logger.info("xlsx output split across %s files, %s sheets", len(paths), sheets)
+    return paths
+
+
+# Formats ``export_dataframe`` writes; the CSV variants and Parquet match
+# ``CHUNK_FORMATS``.
+EXPORT_FORMATS = (*CHUNK_FORMATS, "xlsx")
+
+
+def _arrow_schema(dtypes: pd.Series):
+    """Return the Arrow schema for a whole dataset from its pandas ``dtypes``.
+
+    Text columns (``object`` and ``str``) map to ``large_string`` rather than
+    being inferred from the data, so a block in which such a column is all
+    null cannot pin its type to ``null``.
+    """
+    empty = pd.DataFrame(
+        {i: pd.Series([], dtype=dtype) for i, dtype in enumerate(dtypes)}
+    )
+    empty.columns = dtypes.index
+    schema = pa.Schema.from_pandas(empty, preserve_index=False)
+    for i, dtype in enumerate(dtypes):
+        text = dtype == object or pd.api.types.is_string_dtype(dtype)
+        if text or pa.types.is_null(schema.field(i).type):
+            schema = schema.set(i, schema.field(i).with_type(pa.large_string()))
+    return schema
+
+
+def _export_blocks(df, rows, block_rows: int):
+    """Yield the rows to export as consecutive DataFrame blocks.
+
+    ``rows`` (row positions) are selected block by block, so exporting a
+    subset never materializes it as one frame.  For a ``ChunkedDataset``
+    sorted positions are picked out of each chunk in a single pass.
+    """
+    if isinstance(df, ChunkedDataset):
+        if rows is None:
+            yield from df.iter_chunks()
+            return
+        rows = np.asarray(rows, dtype=np.int64)
+        if np.all(rows[1:] >= rows[:-1]):
+            for chunk in df.iter_chunks():
+                lo, hi = np.searchsorted(rows, [chunk.index.start, chunk.index.stop])
+                if hi > lo:
+                    yield chunk.loc[rows[lo:hi]]
+                if hi == len(rows):
+                    break
+        else:
+            for start in range(0, len(rows), block_rows):
+                yield df.take(rows[start : start + block_rows])
+        return
+
+    total = len(df) if rows is None else len(rows)
+    for start in range(0, total, block_rows):
+        if rows is None:
+            yield df.iloc[start : start + block_rows]
+        else:
+            yield df.iloc[rows[start : start + block_rows]]
+
+
+def export_dataframe(
+    df: pd.DataFrame,
+    path: str,
+    fmt: str = "csv",
+    progress_fn=None,
+    rows=None,
+    block_rows: int = 100_000,
+    xlsx_split: str = "sheets",
+) -> Path:
+    """Export a DataFrame (or ``ChunkedDataset``) in row blocks.
+
+    Parameters
+    ----------
+    df : pd.DataFrame | ChunkedDataset
+        Data to export.
+    path : str
+        Output file.
+    fmt : str, optional
+        One of ``EXPORT_FORMATS``: ``"csv"``, ``"csv.gz"``, ``"csv.zst"``
+        (requires ``zstandard``), ``"parquet"`` (requires ``pyarrow``) or
+        ``"xlsx"``.
+    progress_fn : callable, optional
+        Callback accepting ``(percent, message)``.
+    rows : sequence of int, optional
+        Export only these row positions, in this order (e.g. the result of
+        ``search_dataframe`` on a default ``RangeIndex``).
+    block_rows : int, optional
+        Rows serialized per block for in-memory data.
+    xlsx_split : str, optional
+        Where xlsx rows beyond Excel's ``XLSX_MAX_ROWS`` limit go: extra
+        ``"sheets"`` of the same workbook or extra ``"files"`` named
+        ``<name>_2.xlsx`` and so on.
+
+    Notes
+    -----
+    Each block is serialized on the calling thread while a writer thread
+    compresses and writes the previous one; at most two blocks wait to be
+    written, so memory stays bounded by the block size.  xlsx is streamed
+    through openpyxl's write-only mode (see ``_write_xlsx``).
+    """
     out_path = Path(path)
-    if fmt == "csv":
-        df.to_csv(out_path, index=False)
-    elif fmt == "xlsx":
-        df.to_excel(out_path, index=False)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"fmt must be one of {EXPORT_FORMATS}")
+    if fmt == "parquet" and pa is None:
+        raise ImportError("Parquet export requires the 'pyarrow' package")
+    total = len(df) if rows is None else len(rows)
+    blocks = _export_blocks(df, rows, max(1, int(block_rows)))
+
+    def report(done):
+        if progress_fn:
+            progress_fn(min(done / total * 100, 99) if total else 99, "Exporting")
+
+    report_xlsx = progress_fn and (lambda p, m: progress_fn(p, "Exporting"))
+
+    if fmt == "xlsx":
+        _write_xlsx(blocks, out_path, df.columns, total, report_xlsx, xlsx_split)
     else:
-        raise ValueError("fmt must be 'csv' or 'xlsx'")
-    logger.info("Exported DataFrame to %s", out_path)
+        executor = ThreadPoolExecutor(1)
+        slots = threading.BoundedSemaphore(2)
+        pending = []
+
+        def submit(fn, *args):
+            def job():
+                try:
+                    fn(*args)
+                finally:
+                    slots.release()
+
+            # Blocks while two serialized blocks are still waiting.
+            slots.acquire()
+            pending.append(executor.submit(job))
+            while pending and pending[0].done():
+                pending.pop(0).result()
+
+        done = 0
+        writer = None
+        try:
+            if fmt == "parquet":
+                import pyarrow.parquet as pq
+
+                schema = _arrow_schema(df.dtypes)
+                writer = pq.ParquetWriter(out_path, schema)
+                for block in blocks:
+                    table = pa.Table.from_pandas(
+                        block, schema=schema, preserve_index=False
+                    )
+                    submit(writer.write_table, table)
+                    done += len(block)
+                    report(done)
+            else:
+                writer = _open_chunk_output(out_path, CHUNK_FORMATS[fmt])
+                header = True
+                for block in blocks:
+                    data = block.to_csv(index=False, header=header).encode("utf-8")
+                    header = False
+                    submit(writer.write, data)
+                    done += len(block)
+                    report(done)
+                if header:
+                    submit(writer.write, _empty_csv(df).encode("utf-8"))
+        finally:
+            executor.shutdown(wait=True)
+            if writer is not None:
+                writer.close()
+        for future in pending:
+            future.result()
+
+    if progress_fn:
+        progress_fn(100, "Export complete")
+    logger.info("Exported %s rows to %s", total, out_path)
     print(f"[Data Handler] Exported DataFrame -> {out_path}")
     return out_path
 
 
+def _empty_csv(df) -> str:
+    """Header-only CSV text for an export with no rows."""
+    return pd.DataFrame(columns=list(df.columns)).to_csv(index=False)
+
+
 def export_text(text: str, path: str) -> Path:
     """Write text to ``path`` using UTF-8 encoding."""
     out_path = Path(path)
@@ -7,14 +7,24 @@ from data_handler import (
     load_data,
     run_analysis,
     convert_file,
-    search_dataframe,
     export_dataframe,
     export_text,
+    parse_filters,
+    CHUNK_FORMATS,
+    EXPORT_FORMATS,
+    ChunkedDataset,
+    READER_ENGINES,
+    SEARCH_MODES,
+    SearchSession,
+    query_dataframe,
 )
 import data_handler
 from pathlib import Path
 import json
+import multiprocessing
+import re
 import sys
+import threading
 
 # Global variable to store the DF (SEAN FEATURE BUILDOUT)
 current_df = None
@@ -67,6 +77,12 @@ data_loaded = False
 app_busy = False
 # Default chunk size for CSV splitting operations
 CHUNK_SIZE_DEFAULT = 256
+# Background threads writing chunk files while the next chunk is parsed
+CHUNK_WRITER_THREADS = 2
+# Matches shown while a search is still running, and the typing pause (in
+# seconds) before search-as-you-type fires.
+SEARCH_FIRST_N = 20
+SEARCH_TYPING_DELAY = 0.3
 
 # File conversion helper variables
 convert_input_path = None
@@ -105,10 +121,14 @@ dialog_controls = {
     "export_format": "csv",
     "encoding": "utf-8",
     "delimiter": None,
+    "engine": "c",
+    "compact": False,
     "search_results": None,
     "search_index": 0,
     "convert_format": "csv",
     "analysis_text": "",
+    "chunk_cancel": None,
+    "chunk_format": "csv",
 }
 
 export_context = None
@@ -242,6 +262,21 @@ from pathlib import Path
 # ----------------------------------------------------------------------------------------------------------
 
 
+def populate_column_dropdowns(columns, page: ft.Page) -> None:
+    """Fill the analysis and search column dropdowns with ``columns``."""
+    cd = dialog_controls["column_dropdown"]
+    options = [ft.dropdown.Option("All Columns")] + [
+        ft.dropdown.Option(c) for c in columns
+    ]
+    cd.options = options
+    cd.value = "All Columns"
+    sc = dialog_controls.get("search_column")
+    if sc:
+        sc.options = options
+        sc.value = "All Columns"
+    page.update()
+
+
 async def load_data_result(e: ft.FilePickerResultEvent):
     """Handle data selection and load the chosen file asynchronously."""
     global current_df, data_loaded, app_busy
@@ -270,6 +305,16 @@ async def load_data_result(e: ft.FilePickerResultEvent):
         page.update()
         await asyncio.sleep(0.1)
 
+        # Optional column projection and row filters from Load Options
+        cols_text = dialog_controls["usecols_input"].value or ""
+        usecols = [c.strip() for c in cols_text.split(",") if c.strip()] or None
+        try:
+            filters = parse_filters(dialog_controls["filter_input"].value or "")
+        except ValueError as ex:
+            show_error(str(ex), page)
+            await reset_app_state(page)
+            return
+
         loop = asyncio.get_running_loop()
 
         def progress_cb(p, m):
@@ -283,6 +328,11 @@ async def load_data_result(e: ft.FilePickerResultEvent):
             progress_cb,
             dialog_controls.get("encoding", "utf-8"),
             dialog_controls.get("delimiter"),
+            engine=dialog_controls.get("engine", "c"),
+            compact=dialog_controls.get("compact", False),
+            usecols=usecols,
+            filters=filters or None,
+            dataset_name=dataset_name,
         )
         current_df = df
 
@@ -294,21 +344,13 @@ async def load_data_result(e: ft.FilePickerResultEvent):
             await reset_app_state(page)
             return
 
-        cd = dialog_controls["column_dropdown"]
-        options = [ft.dropdown.Option("All Columns")] + [
-            ft.dropdown.Option(c) for c in current_df.columns
-        ]
-        cd.options = options
-        cd.value = "All Columns"
-        sc = dialog_controls.get("search_column")
-        if sc:
-            sc.options = options
-            sc.value = "All Columns"
-        page.update()
+        populate_column_dropdowns(current_df.columns, page)
 
         info = get_data_stats(df, file_path)
         await write_output(info["log1"], page)
         await write_output(info["log2"], page)
+        if "log3" in info:
+            await write_output(info["log3"], page)
 
         # 4. Toggle buttons now that loading succeeded
         data_loaded = True
@@ -406,6 +448,14 @@ async def handle_chunk_button(e: ft.ControlEvent):
         page.update()
         return
 
+    rows_text = (dialog_controls["chunk_rows_input"].value or "").strip()
+    try:
+        rows_per_chunk = int(rows_text) if rows_text else None
+    except ValueError:
+        dialog_controls["chunk_status"].value = "Rows per chunk must be a number."
+        page.update()
+        return
+
     dialog_controls["chunk_status"].value = "Chunking in progress..."
     app_busy = True
     page.update()
@@ -417,6 +467,9 @@ async def handle_chunk_button(e: ft.ControlEvent):
 
     await show_progress(True, page)
 
+    cancel_event = threading.Event()
+    dialog_controls["chunk_cancel"] = cancel_event
+
     result = await asyncio.to_thread(
         split_into_chunks,
         dataset_name,
@@ -424,11 +477,22 @@ async def handle_chunk_button(e: ft.ControlEvent):
         chunk_size_mb=chunk_size,
         logger_fn=lambda msg: print(msg),
         progress_fn=progress_cb,
+        writer_threads=CHUNK_WRITER_THREADS,
+        byte_ranges=True,
+        cancel_event=cancel_event,
+        output_format=dialog_controls.get("chunk_format", "csv"),
+        rows_per_chunk=rows_per_chunk,
     )
 
+    dialog_controls["chunk_cancel"] = None
     await show_progress(False, page)
 
-    if result and result["total_chunks"] > 0:
+    if result.get("cancelled"):
+        dialog_controls["chunk_status"].value = (
+            f"Chunking cancelled after {result['total_chunks']} files. "
+            "Run again to resume."
+        )
+    elif result and result["total_chunks"] > 0:
         dialog_controls["chunk_status"].value = (
             f"Chunked {result['total_rows']} rows into {result['total_chunks']} files."
         )
@@ -439,6 +503,16 @@ async def handle_chunk_button(e: ft.ControlEvent):
     page.update()
 
 
+def on_cancel_chunking(e: ft.ControlEvent):
+    """Ask a running chunking job to stop after its current chunk."""
+    cancel_event = dialog_controls.get("chunk_cancel")
+    if cancel_event is None:
+        return
+    cancel_event.set()
+    dialog_controls["chunk_status"].value = "Cancelling..."
+    e.page.update()
+
+
 async def on_chunk_csv(e: ft.ControlEvent):
     """Launch CSV chunking using the size stored on the page object."""
     page = e.page
@@ -449,6 +523,44 @@ async def on_chunk_csv(e: ft.ControlEvent):
     await handle_chunk_button(e)
 
 
+async def on_open_chunks(e: ft.ControlEvent):
+    """Use the chunk files of the current dataset as a lazy dataset.
+
+    Analyses, searches and exports then stream through the chunks instead
+    of requiring the whole file in memory.
+    """
+    global current_df, data_loaded, app_busy
+    page = e.page
+
+    file_path = data_handler.saved_filepath
+    if not file_path:
+        dialog_controls["chunk_status"].value = "Please load or chunk a file first."
+        page.update()
+        return
+
+    chunks_dir = create_dataset_environment(Path(file_path).stem)["chunks"]
+    app_busy = True
+    try:
+        ds = ChunkedDataset.from_chunks_dir(chunks_dir)
+        row_count = await asyncio.to_thread(len, ds)
+    except Exception as ex:
+        app_busy = False
+        dialog_controls["chunk_status"].value = "No chunks found. Chunk the file first."
+        await write_output(f"[Error] Failed to open chunks: {ex}", page)
+        page.update()
+        return
+
+    current_df = ds
+    data_loaded = True
+    populate_column_dropdowns(ds.columns, page)
+    dialog_controls["chunk_status"].value = (
+        f"Opened {len(ds.paths)} chunks ({row_count} rows) lazily."
+    )
+    await write_output(f"[Data Handler] Lazy dataset opened from {chunks_dir}", page)
+    app_busy = False
+    page.update()
+
+
 def convert_file_result(e: ft.FilePickerResultEvent):
     """Store the file selected for conversion and update the display."""
     global convert_input_path
@@ -501,6 +613,7 @@ async def on_convert_file(e: ft.ControlEvent):
             convert_output_dir,
             dialog_controls.get("convert_format", "csv"),
             progress_cb,
+            dialog_controls.get("engine", "c"),
         )
         dialog_controls["convert_status"].value = f"Saved to {output_file}"
         await show_progress(False, page)
@@ -543,9 +656,34 @@ async def analysis_handler(e: ft.ControlEvent):
 
     desc = ss.value
 
+    # Optional custom placeholder tokens, comma separated
+    pi = dialog_controls.get("placeholder_input")
+    tokens = [t.strip() for t in (pi.value or "").split(",")] if pi else []
+    placeholders = {t for t in tokens if t} or None
+
+    # Optional duplicate key columns, comma separated
+    ki = dialog_controls.get("dup_key_input")
+    keys = [k.strip() for k in (ki.value or "").split(",")] if ki else []
+    subset = [k for k in keys if k] or None
+
     # Run the analysis on a background thread
     app_busy = True
-    result = await asyncio.to_thread(run_analysis, current_df, atype, col, num, desc)
+    # Lazy datasets are analysed chunk by chunk on every core
+    workers = (os.cpu_count() or 1) if isinstance(current_df, ChunkedDataset) else 0
+    try:
+        result = await asyncio.to_thread(
+            run_analysis,
+            current_df,
+            atype,
+            col,
+            num,
+            desc,
+            workers,
+            placeholders,
+            subset,
+        )
+    except ValueError as ex:
+        result = f"[Error] {ex}"
     dialog_controls["analysis_text"] = result
     await write_output(result, page)
     app_busy = False
@@ -558,14 +696,48 @@ async def show_search_result(page: ft.Page):
     if not results:
         return
     idx = dialog_controls.get("search_index", 0)
-    row = current_df.iloc[[results[idx]]]
+    if isinstance(current_df, ChunkedDataset):
+        row = current_df.take([results[idx]])
+    else:
+        row = current_df.iloc[[results[idx]]]
     await write_output(row.to_string(index=False), page)
     dialog_controls["match_label"].value = f"{idx+1}/{len(results)}"
     page.update()
 
 
+def get_search_session(column, case, mode) -> SearchSession:
+    """Reuse the search session while the dataset and settings are unchanged."""
+    session = dialog_controls.get("search_session")
+    if column not in current_df.columns:
+        column = None
+    if (
+        session is None
+        or session.df is not current_df
+        or (session.column, session.case, session.mode) != (column, case, mode)
+    ):
+        if session is not None:
+            session.cancel()
+        session = SearchSession(
+            current_df, column, case, mode, workers=os.cpu_count() or 1
+        )
+        dialog_controls["search_session"] = session
+    return session
+
+
+async def show_partial_results(term, first, page: ft.Page):
+    """Show the first matches while the rest of the search is running."""
+    if dialog_controls.get("search_pending") != term:
+        return
+    dialog_controls["search_results"] = first
+    dialog_controls["search_index"] = 0
+    await show_search_result(page)
+    dialog_controls["match_label"].value = f"1/{len(first)}+"
+    page.update()
+
+
 async def on_search(e: ft.ControlEvent):
     """Execute a DataFrame search based on UI selections."""
+    global app_busy
     if current_df is None:
         show_error("Load data before searching", e.page)
         return
@@ -574,9 +746,41 @@ async def on_search(e: ft.ControlEvent):
     col_value = dialog_controls["search_column"].value
     column = None if col_value == "All Columns" else col_value
     case = dialog_controls["case_switch"].value
-    whole = dialog_controls["whole_switch"].value
+    mode = dialog_controls.get("search_mode", "literal")
 
-    results = search_dataframe(current_df, term, column, case, whole)
+    if mode == "query":
+        await run_query(term, case, e.page)
+        return
+
+    try:
+        session = get_search_session(column, case, mode)
+    except ValueError as ex:
+        show_error(str(ex), e.page)
+        return
+
+    loop = asyncio.get_running_loop()
+
+    def partial_cb(first):
+        asyncio.run_coroutine_threadsafe(
+            show_partial_results(term, first, e.page), loop
+        )
+
+    # Search off the event loop so the UI stays responsive, on every core.
+    # A newer search supersedes this one, which then returns None.
+    app_busy = True
+    dialog_controls["search_pending"] = term
+    try:
+        results = await asyncio.to_thread(
+            session.search, term, SEARCH_FIRST_N, partial_cb
+        )
+    except re.error as ex:
+        show_error(f"Invalid regular expression: {ex}", e.page)
+        return
+    finally:
+        app_busy = False
+    if results is None:
+        return
+    dialog_controls["search_pending"] = None
     dialog_controls["search_results"] = results
     dialog_controls["search_index"] = 0
 
@@ -588,6 +792,44 @@ async def on_search(e: ft.ControlEvent):
     await show_search_result(e.page)
 
 
+async def run_query(text, case, page: ft.Page):
+    """Run a multi-clause query (see ``parse_query``) and show its matches."""
+    global app_busy
+    app_busy = True
+    try:
+        results = await asyncio.to_thread(
+            query_dataframe, current_df, text, case, os.cpu_count() or 1
+        )
+    except ValueError as ex:
+        show_error(str(ex), page)
+        return
+    finally:
+        app_busy = False
+    dialog_controls["search_pending"] = None
+    dialog_controls["search_results"] = results
+    dialog_controls["search_index"] = 0
+    if not results:
+        await write_output("No matches found.", page)
+        dialog_controls["match_label"].value = "0/0"
+        return
+    await show_search_result(page)
+
+
+async def on_search_typed(e: ft.ControlEvent):
+    """Search as the user types, once they pause briefly.
+
+    Queries only run on the Search button, since a half-typed query is
+    usually not valid yet.
+    """
+    if dialog_controls.get("search_mode") == "query":
+        return
+    term = e.control.value
+    await asyncio.sleep(SEARCH_TYPING_DELAY)
+    if current_df is None or not term or dialog_controls["search_term"].value != term:
+        return
+    await on_search(e)
+
+
 async def on_prev_match(e: ft.ControlEvent):
     results = dialog_controls.get("search_results")
     if not results:
@@ -612,25 +854,45 @@ def clear_search(_: ft.ControlEvent):
         dialog_controls["match_label"].value = "0/0"
 
 
-def export_picker_result(e: ft.FilePickerResultEvent):
-    """Handle path selection from the export file picker."""
-    global export_context
+async def export_picker_result(e: ft.FilePickerResultEvent):
+    """Handle path selection from the export file picker.
+
+    Data exports stream to disk on a worker thread with progress updates;
+    search matches are exported by row position without copying them out
+    of the dataset first.
+    """
+    global export_context, app_busy
     if not e.path:
         return
+    page = e.page
+    fmt = dialog_controls.get("export_format", "csv")
+    loop = asyncio.get_running_loop()
+
+    def progress_cb(p, m):
+        asyncio.run_coroutine_threadsafe(update_progress(p, m, page), loop)
+
     try:
-        if export_context == "dataset" and current_df is not None:
-            export_dataframe(current_df, e.path, dialog_controls.get("export_format", "csv"))
-        elif export_context == "search" and dialog_controls.get("search_results"):
-            df = current_df.iloc[dialog_controls["search_results"]]
-            export_dataframe(df, e.path, dialog_controls.get("export_format", "csv"))
+        if export_context in {"dataset", "search"} and current_df is not None:
+            rows = None
+            if export_context == "search":
+                rows = dialog_controls.get("search_results")
+                if not rows:
+                    return
+            app_busy = True
+            await show_progress(True, page)
+            await asyncio.to_thread(
+                export_dataframe, current_df, e.path, fmt, progress_cb, rows
+            )
         elif export_context == "analysis":
             export_text(dialog_controls.get("analysis_text", ""), e.path)
         dialog_controls["status_label"].value = f"Saved: {e.path}"
     except Exception as ex:
-        show_error(str(ex), e.page)
+        show_error(str(ex), page)
     finally:
+        app_busy = False
         export_context = None
-        e.page.update()
+        await show_progress(False, page)
+        page.update()
 
 
 def export_dataset(e: ft.ControlEvent):
@@ -681,17 +943,31 @@ def build_advanced_content() -> ft.Column:
                 ],
                 spacing=20,
             ),
+            dialog_controls.get("placeholder_input"),
+            dialog_controls.get("dup_key_input"),
             dialog_controls.get("run_btn"),
             ft.Divider(),
             ft.Text("Load Options", weight=ft.FontWeight.BOLD),
-            ft.Row([dialog_controls.get("enc_dropdown"), dialog_controls.get("delim_dropdown")], spacing=10),
+            ft.Row(
+                [
+                    dialog_controls.get("enc_dropdown"),
+                    dialog_controls.get("delim_dropdown"),
+                    dialog_controls.get("engine_dropdown"),
+                    dialog_controls.get("compact_switch"),
+                ],
+                spacing=10,
+            ),
+            ft.Row(
+                [dialog_controls.get("usecols_input"), dialog_controls.get("filter_input")],
+                spacing=10,
+            ),
             ft.Divider(),
             ft.Text("Search", style="titleMedium"),
             ft.Row([dialog_controls.get("search_term"), dialog_controls.get("search_column")], spacing=10),
             ft.Row(
                 [
                     dialog_controls.get("case_switch"),
-                    dialog_controls.get("whole_switch"),
+                    dialog_controls.get("mode_dropdown"),
                     dialog_controls.get("search_btn"),
                 ],
                 spacing=10,
@@ -956,7 +1232,7 @@ async def transition_to_gui(page: ft.Page):
         "Missing Values": "Report null counts.",
         "Duplicate Detection": "Find duplicated rows.",
         "Placeholder Detection": "Check for placeholder tokens.",
-        "Special Character Analysis": "List non-ASCII characters.",
+        "Special Character Analysis": "Count special characters per column.",
     }
 
     desc_text = ft.Text(value="", size=12, color=ft.Colors.BLUE_GREY_600)
@@ -993,6 +1269,16 @@ async def transition_to_gui(page: ft.Page):
     dialog_controls["rows_input"] = rows_input
     dialog_controls["sort_switch"] = sort_switch
     dialog_controls["run_btn"] = run_btn
+    dialog_controls["placeholder_input"] = ft.TextField(
+        label="Placeholders",
+        width=420,
+        tooltip="Comma separated tokens for Placeholder Detection (blank uses defaults)",
+    )
+    dialog_controls["dup_key_input"] = ft.TextField(
+        label="Duplicate key",
+        width=420,
+        tooltip="Comma separated key columns for Duplicate Detection (blank compares whole rows)",
+    )
     dialog_controls["match_label"] = ft.Text("0/0")
 
     enc_dropdown = ft.Dropdown(
@@ -1028,10 +1314,54 @@ async def transition_to_gui(page: ft.Page):
     )
     dialog_controls["delim_dropdown"] = delim_dropdown
 
-    search_term = ft.TextField(label="Search term", width=200, tooltip="Enter text to search")
+    engine_dropdown = ft.Dropdown(
+        label="Engine",
+        width=120,
+        value="c",
+        options=[ft.dropdown.Option(name) for name in READER_ENGINES],
+        on_change=lambda e: dialog_controls.__setitem__("engine", e.control.value),
+        tooltip="CSV reader engine (pyarrow uses all cores)",
+    )
+    dialog_controls["engine_dropdown"] = engine_dropdown
+
+    compact_switch = ft.Switch(
+        label="Compact",
+        value=False,
+        on_change=lambda e: dialog_controls.__setitem__("compact", e.control.value),
+        tooltip="Downcast numbers and encode repeated text as categories",
+    )
+    dialog_controls["compact_switch"] = compact_switch
+
+    dialog_controls["usecols_input"] = ft.TextField(
+        label="Columns",
+        width=200,
+        tooltip="Comma separated columns to load (blank loads all)",
+    )
+    dialog_controls["filter_input"] = ft.TextField(
+        label="Row filter",
+        width=200,
+        tooltip="e.g. status == OK; amount >= 100",
+    )
+
+    search_term = ft.TextField(
+        label="Search term",
+        width=200,
+        tooltip="Enter text to search",
+        on_change=on_search_typed,
+    )
     search_column = ft.Dropdown(label="Search Column", width=150, options=[ft.dropdown.Option("All Columns")])
     case_switch = ft.Switch(label="Case", value=False)
-    whole_switch = ft.Switch(label="Whole", value=False)
+    mode_dropdown = ft.Dropdown(
+        label="Mode",
+        width=120,
+        value="literal",
+        options=[ft.dropdown.Option(m) for m in (*SEARCH_MODES, "query")],
+        on_change=lambda e: dialog_controls.__setitem__("search_mode", e.control.value),
+        tooltip=(
+            "literal: plain text, whole: whole words, prefix: word starts, "
+            "regex: pattern, query: e.g. city:york amount:100..500 OR smith~"
+        ),
+    )
     search_btn = ft.ElevatedButton(text="Search", on_click=on_search)
     prev_btn = ft.IconButton(icon=ft.Icons.ARROW_BACK, on_click=on_prev_match, tooltip="Previous")
     next_btn = ft.IconButton(icon=ft.Icons.ARROW_FORWARD, on_click=on_next_match, tooltip="Next")
@@ -1039,7 +1369,7 @@ async def transition_to_gui(page: ft.Page):
     dialog_controls["search_term"] = search_term
     dialog_controls["search_column"] = search_column
     dialog_controls["case_switch"] = case_switch
-    dialog_controls["whole_switch"] = whole_switch
+    dialog_controls["mode_dropdown"] = mode_dropdown
     dialog_controls["search_btn"] = search_btn
     dialog_controls["prev_btn"] = prev_btn
     dialog_controls["next_btn"] = next_btn
@@ -1048,7 +1378,7 @@ async def transition_to_gui(page: ft.Page):
         label="Format",
         width=120,
         value="csv",
-        options=[ft.dropdown.Option("csv"), ft.dropdown.Option("xlsx")],
+        options=[ft.dropdown.Option(f) for f in EXPORT_FORMATS],
         on_change=lambda e: dialog_controls.__setitem__("export_format", e.control.value),
     )
     dialog_controls["export_fmt"] = export_fmt
@@ -1071,6 +1401,19 @@ async def transition_to_gui(page: ft.Page):
         on_change=lambda e: setattr(page, "chunk_size", int(e.control.value)),
     )
     dialog_controls["chunk_status"] = ft.Text(value="", color=ft.Colors.GREY_700)
+    dialog_controls["chunk_rows_input"] = ft.TextField(
+        label="Rows per chunk",
+        width=150,
+        tooltip="Leave blank to size chunks in MB",
+    )
+    dialog_controls["chunk_format_dropdown"] = ft.Dropdown(
+        label="Format",
+        width=120,
+        value="csv",
+        options=[ft.dropdown.Option(fmt) for fmt in CHUNK_FORMATS],
+        on_change=lambda e: dialog_controls.__setitem__("chunk_format", e.control.value),
+        tooltip="Chunk file format",
+    )
 
     csv_chunker_card = ft.Card(
         elevation=3,
@@ -1079,6 +1422,14 @@ async def transition_to_gui(page: ft.Page):
             content=ft.Column(
                 [
                     ft.Text("CSV Chunker", style="headlineSmall"),
+                    ft.Row(
+                        [
+                            dialog_controls["chunk_rows_input"],
+                            dialog_controls["chunk_format_dropdown"],
+                        ],
+                        spacing=16,
+                        alignment="start",
+                    ),
                     ft.Row(
                         [
                             dialog_controls["chunk_size_input"],
@@ -1087,6 +1438,17 @@ async def transition_to_gui(page: ft.Page):
                                 icon=SPLIT_CSV_ICON,
                                 on_click=on_chunk_csv,
                             ),
+                            ft.ElevatedButton(
+                                text="Cancel",
+                                icon=ft.Icons.CANCEL,
+                                on_click=on_cancel_chunking,
+                            ),
+                            ft.ElevatedButton(
+                                text="Open Chunks",
+                                icon=ft.Icons.FOLDER_OPEN,
+                                on_click=on_open_chunks,
+                                tooltip="Analyse the chunk files without loading them",
+                            ),
                         ],
                         spacing=16,
                         alignment="start",
@@ -1228,4 +1590,6 @@ async def transition_to_gui(page: ft.Page):
 
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
     ft.app(target=main, assets_dir="assets")
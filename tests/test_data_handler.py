@@ -1,10 +1,36 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import sys, os
+import gc
+import io
+import threading
+
+import pytest
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from data_handler import load_data, convert_file, search_dataframe
+import data_handler
+
+from data_handler import (
+    find_duplicates,
+    ChunkedDataset,
+    export_dataframe,
+    run_analysis,
+    split_into_chunks,
+    load_chunk_manifest,
+    locate_chunk,
+    load_data,
+    convert_file,
+    search_dataframe,
+    SearchSession,
+    parse_query,
+    query_dataframe,
+    build_search_index,
+    compact_dataframe,
+    get_data_stats,
+    parse_filters,
+)
 
 def test_load_data_with_params(tmp_path):
     p = tmp_path / "sample.csv"
@@ -27,3 +53,665 @@ def test_search_dataframe():
     assert idx == [0, 2]
     idx_case = search_dataframe(df, "foo", column="col", case=True)
     assert idx_case == [2]
+
+
+def test_load_data_single_pass_progress(tmp_path):
+    p = tmp_path / "big.csv"
+    p.write_text("a,b\n" + "".join(f"{i},x{i}\n" for i in range(25000)), encoding="utf-8")
+    updates = []
+    df = load_data(str(p), lambda pct, msg: updates.append(pct))
+    assert df.shape == (25000, 2)
+    loading = updates[1:-1]
+    assert loading and loading == sorted(loading)
+    assert updates[-1] == 100
+    assert load_data(str(p), None, single_pass=False).equals(df)
+
+
+def test_load_data_engines(tmp_path):
+    p = tmp_path / "sample.csv"
+    p.write_text("a,b\n1,x\n2,y\n", encoding="utf-8")
+    df = load_data(str(p), engine="pyarrow")
+    assert isinstance(df["b"].dtype, pd.ArrowDtype)
+    assert df["a"].tolist() == [1, 2]
+    txt = tmp_path / "sample.txt"
+    txt.write_text("a  b\n1   x\n2 y\n", encoding="utf-8")
+    for engine in ("c", "pyarrow", "python"):
+        out = convert_file(str(txt), str(tmp_path / engine), "csv", engine=engine)
+        assert pd.read_csv(out)["b"].tolist() == ["x", "y"]
+
+
+def test_load_data_pyarrow_late_type_change(tmp_path):
+    # Columns change type well past Arrow's first 1 MB block.
+    p = tmp_path / "late.csv"
+    p.write_text(
+        "a,b,c\n"
+        + "".join(f"{i},,{i}\n" for i in range(150000))
+        + "".join(f"{i},x{i},t{i}\n" for i in range(150000, 200000)),
+        encoding="utf-8",
+    )
+    df = load_data(str(p), engine="pyarrow")
+    assert len(df) == 200000
+    assert df["b"].iloc[-1] == "x199999" and df["c"].iloc[0] == "0"
+
+
+def test_load_data_bounded_memory(tmp_path):
+    p = tmp_path / "big.csv"
+    p.write_text("a,b\n" + "".join(f"{i},x{i}\n" for i in range(25000)), encoding="utf-8")
+    df = load_data(str(p), bounded_memory=True)
+    expected = load_data(str(p))
+    assert df.shape == expected.shape
+    assert df["a"].tolist() == expected["a"].tolist()
+    assert load_data(str(p), bounded_memory=True, max_memory_mb=0.01) is None
+
+
+def test_load_data_bounded_memory_sparse_column(tmp_path, caplog):
+    p = tmp_path / "sparse.csv"
+    # ``b`` is blank for the first chunk; ``c`` is int there and text later.
+    p.write_text(
+        "a,b,c\n"
+        + "".join(
+            f"{i},{'' if i < 15000 else f'x{i}'},{i if i < 15000 else f't{i}'}\n"
+            for i in range(25000)
+        ),
+        encoding="utf-8",
+    )
+    df = load_data(str(p), bounded_memory=True)
+    assert "Falling back" not in caplog.text
+    assert df["b"].count() == 10000 and df["b"].iloc[-1] == "x24999"
+    assert df["c"].iloc[0] == "0" and df["c"].iloc[-1] == "t24999"
+
+
+def test_compact_dataframe_and_stats(tmp_path):
+    df = pd.DataFrame(
+        {
+            "code": ["OK", "FAIL"] * 500,
+            "n": list(range(1000)),
+            "f": [0.5] * 1000,
+            "when": ["2024-01-02"] * 1000,
+            "id": [f"id{i}" for i in range(1000)],
+        }
+    )
+    out = compact_dataframe(df.copy())
+    assert str(out["code"].dtype) == "category"
+    assert out["n"].dtype == "int16"
+    assert out["f"].dtype == "float32"
+    assert pd.api.types.is_datetime64_any_dtype(out["when"])
+    assert not isinstance(out["id"].dtype, pd.CategoricalDtype)
+    assert out.attrs["memory_after"] < out.attrs["memory_before"]
+
+    src = tmp_path / "data.csv"
+    df.to_csv(src, index=False)
+    stats = get_data_stats(load_data(str(src), compact=True), str(src))
+    assert stats["memory_after"] < stats["memory_before"]
+
+
+def test_load_data_pushdown(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": list("wxyz"), "c": [0.1] * 4})
+    src = tmp_path / "data.csv"
+    df.to_csv(src, index=False)
+    filters = parse_filters("a >= 2; b != y")
+    assert filters == [("a", ">=", 2), ("b", "!=", "y")]
+    for engine in ("c", "pyarrow"):
+        out = load_data(str(src), usecols=["b"], filters=filters, engine=engine)
+        assert out.columns.tolist() == ["b"]
+        assert out["b"].tolist() == ["x", "z"]
+    pq = tmp_path / "data.parquet"
+    df.to_parquet(pq)
+    out = load_data(str(pq), usecols=["a", "b"], filters=[("b", "in", ["w", "z"])])
+    assert out.columns.tolist() == ["a", "b"]
+    assert out["a"].tolist() == [1, 4]
+
+    # Quoted literals stay strings; unquoted numbers are still cast.
+    zips = pd.DataFrame({"zip": ["02134", "10001"], "n": [1, 2]})
+    zips.to_parquet(pq)
+    filters = parse_filters("zip == '02134'; n in 1, \"2\"")
+    assert filters == [("zip", "==", "02134"), ("n", "in", [1, "2"])]
+    out = load_data(str(pq), filters=parse_filters("zip == '02134'"))
+    assert out["n"].tolist() == [1]
+
+
+ANALYSES = [
+    "Data Preview",
+    "Missing Values",
+    "Duplicate Detection",
+    "Placeholder Detection",
+    "Special Character Analysis",
+]
+
+
+def test_chunked_dataset_matches_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame(
+        {
+            "name": ["ann", "bob", "N/A", "ann", "c@t", None] * 50,
+            "score": [1, 2, None, 1, 5, 6] * 50,
+            # Blank in the first chunks: the combined dtype must still be str.
+            "notes": [None] * 250 + ["late"] * 50,
+            # Blank after the first chunks: int becomes float64, bool object.
+            "n": list(range(100)) + [None] * 200,
+            "flag": [True, False] * 50 + [None] * 200,
+        }
+    )
+    src = tmp_path / "people.csv"
+    df.to_csv(src, index=False)
+    result = split_into_chunks("people", str(src), chunk_size_mb=0.001)
+    assert result["total_chunks"] > 1
+
+    full = load_data(str(src))
+    ds = ChunkedDataset.from_chunks_dir(result["output_dir"])
+    assert len(ds) == len(full)
+    assert ds.dtypes.equals(full.dtypes)
+    for analysis in ANALYSES:
+        for column in (None, "name"):
+            for desc in (False, True):
+                expected = run_analysis(full, analysis, column, 5, desc)
+                assert run_analysis(ds, analysis, column, 5, desc) == expected
+    assert search_dataframe(ds, "bob") == search_dataframe(full, "bob")
+    out = export_dataframe(ds, tmp_path / "out.csv")
+    assert pd.read_csv(out).equals(pd.read_csv(src))
+
+    # Numbers then text: chunks keep their parsed values under ``object``.
+    mixed = tmp_path / "mixed.csv"
+    values = ["0000" if i % 3 == 0 else str(i) for i in range(20000)]
+    values += [f"t{i}" for i in range(1000)]
+    mixed.write_text("z\n" + "\n".join(values) + "\n", encoding="utf-8")
+    full = load_data(str(mixed))
+    ds = ChunkedDataset.from_chunks_dir(
+        split_into_chunks("mixed", str(mixed), rows_per_chunk=5000)["output_dir"]
+    )
+    assert ds.dtypes.equals(full.dtypes)
+    for analysis in ANALYSES:
+        assert run_analysis(ds, analysis) == run_analysis(full, analysis)
+
+
+def test_split_into_chunks_writer_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "rows.csv"
+    src.write_text("a,b\n" + "".join(f"{i},val{i}\n" for i in range(2000)), encoding="utf-8")
+    sync = split_into_chunks("sync", str(src), chunk_size_mb=0.002)
+    piped = split_into_chunks("piped", str(src), chunk_size_mb=0.002, writer_threads=3)
+    assert sync["total_chunks"] == piped["total_chunks"] > 1
+    for i in range(sync["total_chunks"]):
+        name = f"rows_chunk_{i}.csv"
+        a = (Path(sync["output_dir"]) / name).read_bytes()
+        assert a == (Path(piped["output_dir"]) / name).read_bytes()
+
+
+def test_split_into_chunks_byte_ranges(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame(
+        {
+            "id": range(600),
+            "note": [f'line one\nline "two", {i}' if i % 7 == 0 else f"n{i}" for i in range(600)],
+        }
+    )
+    src = tmp_path / "quoted.csv"
+    df.to_csv(src, index=False)
+    rows = split_into_chunks("rows", str(src), chunk_size_mb=0.002)
+    raw = split_into_chunks("raw", str(src), chunk_size_mb=0.002, byte_ranges=True)
+    assert raw["total_rows"] == rows["total_rows"] == 600
+    assert raw["total_chunks"] > 1
+    parts = [
+        pd.read_csv(Path(raw["output_dir"]) / f"quoted_chunk_{i}.csv")
+        for i in range(raw["total_chunks"])
+    ]
+    assert pd.concat(parts, ignore_index=True).equals(df)
+
+
+def test_split_into_chunks_byte_ranges_mid_field_quotes(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "inch.csv"
+    src.write_text(
+        'a,b\n1,12" pipe\n' + "".join(f"{i},v{i}\n" for i in range(2, 3000)),
+        encoding="utf-8",
+    )
+    rows = split_into_chunks("rows", str(src), chunk_size_mb=0.005)
+    raw = split_into_chunks("raw", str(src), chunk_size_mb=0.005, byte_ranges=True)
+    assert raw["total_rows"] == rows["total_rows"] == 2999
+    assert raw["total_chunks"] > 1
+    ds = ChunkedDataset.from_chunks_dir(raw["output_dir"])
+    assert pd.concat(ds.iter_chunks())["b"].iloc[0] == '12" pipe'
+    assert locate_chunk(raw["output_dir"], 2000) is not None
+
+    # An unterminated quote runs past a whole chunk; row mode takes over.
+    src.write_text(
+        'a,b\n1,"open\n' + "".join(f"{i},v{i}\n" for i in range(2, 3000)),
+        encoding="utf-8",
+    )
+    logged = []
+    runaway = split_into_chunks(
+        "runaway", str(src), chunk_size_mb=0.005, byte_ranges=True, logger_fn=logged.append
+    )
+    assert any("row-by-row" in msg for msg in logged)
+    assert load_chunk_manifest(runaway["output_dir"])["settings"]["byte_ranges"] is False
+
+
+def test_split_into_chunks_manifest_and_rerun(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "rows.csv"
+    src.write_text("a,b\n" + "".join(f"{i},v{i}\n" for i in range(2000)), encoding="utf-8")
+    first = split_into_chunks("ds", str(src), chunk_size_mb=0.002, byte_ranges=True)
+    manifest = load_chunk_manifest(first["output_dir"])
+    assert manifest["total_rows"] == 2000
+    assert len(manifest["chunks"]) == first["total_chunks"]
+    assert manifest["chunks"][-1]["byte_end"] == src.stat().st_size
+    assert locate_chunk(first["output_dir"], 1999).name == manifest["chunks"][-1]["file"]
+
+    chunk0 = Path(first["output_dir"]) / manifest["chunks"][0]["file"]
+    before = chunk0.stat().st_mtime_ns
+    again = split_into_chunks("ds", str(src), chunk_size_mb=0.002, byte_ranges=True)
+    assert again["total_chunks"] == first["total_chunks"]
+    assert chunk0.stat().st_mtime_ns == before
+
+    src.write_text("a,b\n1,x\n", encoding="utf-8")
+    small = split_into_chunks("ds", str(src), chunk_size_mb=0.002, byte_ranges=True)
+    assert small["total_chunks"] == 1
+    assert sorted(p.name for p in Path(small["output_dir"]).glob("*.csv")) == ["rows_chunk_0.csv"]
+
+
+def test_split_into_chunks_cancel_and_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "rows.csv"
+    src.write_text("a,b\n" + "".join(f"{i},v{i}\n" for i in range(2000)), encoding="utf-8")
+    for byte_ranges in (False, True):
+        name = f"resume_{byte_ranges}"
+        stop = threading.Event()
+
+        def log(msg):
+            if msg.startswith("Chunk 1 written"):
+                stop.set()
+
+        part = split_into_chunks(
+            name, str(src), 0.002, logger_fn=log, byte_ranges=byte_ranges, cancel_event=stop
+        )
+        assert part["cancelled"] and part["total_chunks"] == 2
+        chunk0 = Path(part["output_dir"]) / "rows_chunk_0.csv"
+        before = chunk0.stat().st_mtime_ns
+
+        done = split_into_chunks(name, str(src), 0.002, byte_ranges=byte_ranges)
+        assert done["total_rows"] == 2000 and "cancelled" not in done
+        assert chunk0.stat().st_mtime_ns == before
+        parts = [
+            pd.read_csv(Path(done["output_dir"]) / f"rows_chunk_{i}.csv")
+            for i in range(done["total_chunks"])
+        ]
+        assert pd.concat(parts)["a"].tolist() == list(range(2000))
+
+
+def test_split_into_chunks_formats(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "rows.csv"
+    src.write_text("a,b\n" + "".join(f"{i},v{i}\n" for i in range(1000)), encoding="utf-8")
+
+    pq = split_into_chunks(
+        "pq", str(src), output_format="parquet", rows_per_chunk=300, row_group_size=100
+    )
+    assert pq["total_chunks"] == 4 and pq["total_rows"] == 1000
+    ds = ChunkedDataset.from_chunks_dir(pq["output_dir"])
+    assert ds.paths[0].endswith("rows_chunk_0.parquet")
+    assert len(ds) == 1000
+    assert ds.take([0, 999])["a"].tolist() == [0, 999]
+
+    gz = split_into_chunks("gz", str(src), 0.002, byte_ranges=True, output_format="csv.gz")
+    counted = split_into_chunks("rows", str(src), output_format="csv", rows_per_chunk=250)
+    assert counted["total_chunks"] == 4
+    for result in (gz, counted):
+        ds = ChunkedDataset.from_chunks_dir(result["output_dir"])
+        assert pd.concat(ds.iter_chunks())["a"].tolist() == list(range(1000))
+
+
+def test_split_into_chunks_zstd(tmp_path, monkeypatch):
+    zstandard = pytest.importorskip("zstandard")
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "rows.csv"
+    src.write_text("a,b\n" + "".join(f"{i},v{i}\n" for i in range(1000)), encoding="utf-8")
+    zst = split_into_chunks("zst", str(src), 0.002, byte_ranges=True, output_format="csv.zst")
+    assert zst["total_chunks"] > 1 and zst["total_rows"] == 1000
+    parts = []
+    for i in range(zst["total_chunks"]):
+        with open(Path(zst["output_dir"]) / f"rows_chunk_{i}.csv.zst", "rb") as f:
+            reader = zstandard.ZstdDecompressor().stream_reader(f)
+            parts.append(pd.read_csv(io.BytesIO(reader.read())))
+    assert pd.concat(parts)["a"].tolist() == list(range(1000))
+
+
+def test_run_analysis_process_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame({"name": ["a#", "b", "N/A", "a#", None] * 40, "n": range(200)})
+    df.loc[150:, "n"] = 0
+    src = tmp_path / "pool.csv"
+    df.to_csv(src, index=False)
+    result = split_into_chunks("pool", str(src), rows_per_chunk=50)
+    full = load_data(str(src))
+    for analysis in ANALYSES:
+        expected = run_analysis(full, analysis, None, 5)
+        ds = ChunkedDataset.from_chunks_dir(result["output_dir"])
+        assert run_analysis(ds, analysis, None, 5, workers=2) == expected
+
+
+def test_placeholder_detection_custom_tokens():
+    df = pd.DataFrame(
+        {
+            "s": [" N/A", "ok", None, "tbd", "ok"],
+            "cat": pd.Series(["NA", "x", "NA", None, "y"], dtype="category"),
+            "n": [0, 1, 2, 0, 0],
+        }
+    )
+    def rows(report):
+        return {
+            cells[0]: int(cells[1])
+            for line in report.splitlines()
+            if (cells := [c.strip() for c in line.strip("│").split("│")])[0] in df.columns
+        }
+
+    assert rows(run_analysis(df, "Placeholder Detection")) == {"s": 2, "cat": 2}
+    custom = run_analysis(df, "Placeholder Detection", placeholders={"0", "ok"})
+    assert rows(custom) == {"s": 2, "n": 3}
+
+    # Missing cells count as ``astype(str)`` renders them, as before.
+    obj = pd.DataFrame({"o": pd.Series(["x", None, "N/A", np.nan], dtype=object)})
+    for tokens in (None, {"None", "nan"}):
+        expected = obj["o"].astype(str).str.strip().isin(tokens or data_handler.PLACEHOLDERS)
+        assert data_handler._placeholder_partial(obj, tokens)["o"] == expected.sum()
+
+
+def test_special_character_frequencies():
+    df = pd.DataFrame({"email": ["a@b.c", "a@b.c", "plain", None, "x#y!"], "n": [1, 2, 3, 4, 5]})
+    report = run_analysis(df, "Special Character Analysis")
+    assert ".:2, @:2, !:1, #:1" in report
+    assert "│ n " not in report
+    assert run_analysis(df[["n"]], "Special Character Analysis") == "No special characters found."
+
+
+def test_find_duplicates_spill_and_subset(tmp_path):
+    df = pd.DataFrame({"k": [i % 7 for i in range(100)], "v": list(range(100))})
+    df.loc[[3, 50, 90], "v"] = -1
+    df.loc[[3, 50, 90], "k"] = 3
+    df.loc[[10, 20], ["k", "v"]] = [0, -2]
+    in_memory = find_duplicates(df, num_rows=3)
+    spilled = find_duplicates(df, num_rows=3, spill_rows=10, spill_dir=tmp_path)
+    for stats in (in_memory, spilled):
+        assert stats["duplicate_entries"] == 5
+        assert stats["unique_duplicates"] == 3
+        assert stats["group_sizes"] == {3: 1, 2: 1}
+        assert stats["largest_group"] == 3
+        assert stats["sample_positions"].tolist() == [3, 10, 20]
+    assert list(tmp_path.iterdir()) == []
+    keyed = find_duplicates(df, subset=["k"], sort_desc=True, num_rows=2)
+    assert keyed["groups"] == 7 and keyed["duplicate_entries"] == 100
+    assert keyed["sample_positions"].tolist() == [99, 98]
+    report = run_analysis(df, "Duplicate Detection", subset=["k"])
+    assert "Largest group" in report
+
+
+def test_run_analysis_does_not_copy(monkeypatch):
+    df = pd.DataFrame({"a": [1, 2, 2, None], "b": ["x", "N/A", "N/A", "y!"]})
+    expected = {a: run_analysis(df, a) for a in ANALYSES if a != "Data Preview"}
+
+    def no_copy(self, deep=True):
+        raise AssertionError("run_analysis copied the frame")
+
+    getitem = pd.DataFrame.__getitem__
+
+    def no_full_selection(self, key):
+        # Without copy-on-write (pandas 2) this selection copies every column.
+        if isinstance(key, list) and key == list(self.columns):
+            raise AssertionError("run_analysis selected every column")
+        return getitem(self, key)
+
+    monkeypatch.setattr(pd.DataFrame, "copy", no_copy)
+    monkeypatch.setattr(pd.DataFrame, "__getitem__", no_full_selection)
+    for analysis, report in expected.items():
+        # Duplicate samples follow ``sort_desc``; the others ignore it.
+        desc = analysis != "Duplicate Detection"
+        assert run_analysis(df, analysis, sort_desc=desc) == report
+    preview = run_analysis(df, "Data Preview", num_rows=2, sort_desc=True)
+    assert preview.index("y!") < preview.index("N/A")
+
+
+def test_analysis_profile_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "cache.csv"
+    pd.DataFrame({"a": [1, None, 1], "b": ["x", "N/A", "x"]}).to_csv(src, index=False)
+    df = load_data(str(src))
+    reports = {a: run_analysis(df, a) for a in ANALYSES}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("profile was recomputed")
+
+    with monkeypatch.context() as m:
+        for name in ("_missing_partial", "_hash_partial", "_placeholder_partial", "_special_partial"):
+            m.setattr(data_handler, name, fail)
+        for analysis, report in reports.items():
+            assert run_analysis(df, analysis) == report
+        assert "│ a " in run_analysis(df, "Missing Values", column="a")
+        # Frames derived from ``df`` share its attrs but not its profile.
+        with pytest.raises(AssertionError):
+            run_analysis(df.head(2), "Missing Values")
+
+    src.write_text("a,b\n1,x\n1,x\n")
+    reloaded = load_data(str(src))
+    assert run_analysis(reloaded, "Missing Values") == "No missing values detected."
+
+    # Profiles go away with their dataset.
+    key = reloaded.attrs["profile_key"]
+    search_dataframe(reloaded, "x")
+    del df, reloaded
+    gc.collect()
+    assert key not in data_handler._PROFILES
+
+
+def test_load_data_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "daily.csv"
+    pd.DataFrame({"a": [1, None, 3], "b": ["x", "y", "x"]}).to_csv(src, index=False)
+    first = load_data(str(src), compact=True, dataset_name="daily")
+    env = tmp_path / "Documents" / "ProtexxaDatascope" / "daily"
+    assert (env / "stages" / "daily.parquet").exists()
+    assert (env / "process" / "daily_profile.json").exists()
+
+    with monkeypatch.context() as m:
+        m.setattr(data_handler, "_iter_text_chunks", None)
+        m.setattr(data_handler, "_missing_partial", None)
+        again = load_data(str(src), compact=True, dataset_name="daily")
+        assert again.equals(first)
+        assert again.attrs["memory_after"] == first.attrs["memory_after"]
+        assert "1" in run_analysis(again, "Missing Values")
+
+    src.write_text("a,b\n7,z\n")
+    assert load_data(str(src), compact=True, dataset_name="daily")["a"].tolist() == [7]
+
+
+def test_search_token_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    src = tmp_path / "words.csv"
+    pd.DataFrame(
+        {
+            "city": ["New York", "Newark", "york", None, "new-york", "NEW YORKER"],
+            "n": [1, 2, 3, 4, 5, 6],
+        }
+    ).to_csv(src, index=False)
+    df = load_data(str(src))
+    assert not build_search_index(df.head(3))
+    assert build_search_index(df, "city")
+    indexes = data_handler._profile_for(df).values["search_index"]
+    assert indexes["city"].rows.dtype == np.int32
+    # Numeric columns are never indexed; word queries scan them.
+    assert build_search_index(df) and set(indexes) == {"city"}
+
+    queries = [
+        ("york", {"whole": True}),
+        ("new york", {"whole": True}),
+        ("York", {"whole": True, "case": True}),
+        ("new", {"prefix": True}),
+        ("3", {"whole": True}),
+    ]
+    expected = [search_dataframe(df, t, use_index=False, **kw) for t, kw in queries]
+    assert expected[0] == [0, 2, 4]
+    assert [search_dataframe(df, t, **kw) for t, kw in queries] == expected
+
+    monkeypatch.setattr(data_handler, "_search_mask", None)
+    assert search_dataframe(df, "newark", "city", whole=True) == [1]
+
+
+def test_search_modes_escape_terms():
+    df = pd.DataFrame({"v": ["a.b", "axb", "f(x)", "A.B c", None]})
+    assert search_dataframe(df, "a.b") == [0, 3]
+    assert search_dataframe(df, "a.b", case=True) == [0]
+    assert search_dataframe(df, "a.b", mode="regex") == [0, 1, 3]
+    assert search_dataframe(df, "f(x)", mode="whole") == []
+    assert search_dataframe(df, "(x", mode="literal") == [2]
+    assert search_dataframe(df, "a.b", mode="whole") == [0, 3]
+    assert search_dataframe(df, "a.", mode="prefix") == [0, 3]
+    with pytest.raises(ValueError):
+        search_dataframe(df, "a", mode="fuzzy")
+
+
+def test_parallel_search(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame(
+        {f"c{i}": [f"v{(r * (i + 1)) % 17}" for r in range(120)] for i in range(6)}
+    )
+    src = tmp_path / "wide.csv"
+    df.to_csv(src, index=False)
+    result = split_into_chunks("wide", str(src), rows_per_chunk=25)
+    ds = ChunkedDataset.from_chunks_dir(result["output_dir"])
+    for mode in ("literal", "whole", "regex"):
+        expected = search_dataframe(df, "v1", mode=mode)
+        assert expected == sorted(expected) and expected
+        assert search_dataframe(df, "v1", mode=mode, workers=4) == expected
+        assert search_dataframe(ds, "v1", mode=mode, workers=2) == expected
+
+    # Only the lower-cased text of a loaded dataset is cached.
+    loaded = load_data(str(src))
+    search_dataframe(loaded, "V1", use_index=False)
+    search_dataframe(loaded, "v1", case=True, use_index=False)
+    profile = data_handler._profile_for(loaded)
+    assert set(profile.values) == {"lower"}
+
+
+def test_search_session_refines_and_cancels(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame({"w": [f"item{i}" for i in range(300)], "n": range(300)})
+    session = SearchSession(df, block_rows=50)
+    partial = []
+    assert session.search("item1", 5, partial.append) == search_dataframe(df, "item1")
+    assert partial == [[1, 10, 11, 12, 13]]
+
+    # Extending the term only rescans the previous matches.
+    expected = search_dataframe(df, "item12")
+    with monkeypatch.context() as m:
+        m.setattr(data_handler, "_column_text", lambda *a, **k: pytest.fail())
+        assert session.search("item12") == expected
+
+    # A search that is superseded mid-scan reports None.
+    assert session.search("em2", 1, lambda _: session.cancel()) is None
+    assert session.search("em2") == search_dataframe(df, "em2")
+
+    src = tmp_path / "items.csv"
+    df.to_csv(src, index=False)
+    result = split_into_chunks("items", str(src), rows_per_chunk=40)
+    ds = ChunkedDataset.from_chunks_dir(result["output_dir"])
+    chunked = SearchSession(ds, column="w", mode="prefix")
+    assert chunked.search("item2") == search_dataframe(df, "item2", mode="prefix")
+    assert chunked.search("item29") == search_dataframe(df, "item29", mode="prefix")
+
+
+def test_query_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame(
+        {
+            "city": ["New York", "york", "Paris", "Yrok", "Lima"],
+            "amount": [50, 150, 200, None, 120],
+            "name": ["Smith", "Smyth", "Jones", "smith!", "Lee"],
+        }
+    )
+    assert parse_query('city:york amount:>=100 OR "full name":"Ann Lee"') == [
+        [("text", "city", "york"), ("range", "amount", (100.0, None, True, True))],
+        [("text", "full name", "Ann Lee")],
+    ]
+    assert query_dataframe(df, "city:york amount:>=100") == [1]
+    assert query_dataframe(df, "smith~ OR amount:150..200") == [0, 1, 2, 3]
+    assert query_dataframe(df, "city:yrok~1") == [3]
+    assert query_dataframe(df, "amount:<100 AND york") == [0]
+    assert query_dataframe(df, "12:30") == []
+    with pytest.raises(ValueError):
+        query_dataframe(df, "missing:1..2")
+
+    src = tmp_path / "q.csv"
+    df.to_csv(src, index=False)
+    result = split_into_chunks("q", str(src), rows_per_chunk=2)
+    ds = ChunkedDataset.from_chunks_dir(result["output_dir"])
+    assert query_dataframe(ds, "smith~ OR city:lima", workers=2) == [0, 1, 3, 4]
+
+
+def test_export_dataframe_streaming(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame({"n": range(250), "s": [f"r{i}" for i in range(250)]})
+    for fmt, read in (("csv.gz", pd.read_csv), ("parquet", pd.read_parquet)):
+        progress = []
+        out = export_dataframe(
+            df, tmp_path / f"all.{fmt}", fmt, lambda p, m: progress.append(p), block_rows=60
+        )
+        assert read(out).equals(df)
+        assert progress[-1] == 100 and len(progress) == 6
+
+    src = tmp_path / "exp.csv"
+    df.to_csv(src, index=False)
+    ds = ChunkedDataset.from_chunks_dir(
+        split_into_chunks("exp", str(src), rows_per_chunk=70)["output_dir"]
+    )
+    rows = search_dataframe(ds, "r1")
+    out = export_dataframe(ds, tmp_path / "hits.csv", rows=rows)
+    assert pd.read_csv(out)["n"].tolist() == rows
+    out = export_dataframe(df, tmp_path / "picked.csv", rows=[5, 3])
+    assert pd.read_csv(out)["s"].tolist() == ["r5", "r3"]
+
+
+def test_export_parquet_sparse_columns(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    df = pd.DataFrame({"n": range(200), "s": [None] * 120 + [f"v{i}" for i in range(80)]})
+    df["s"] = df["s"].astype(object)
+    out = export_dataframe(df, tmp_path / "sparse.parquet", "parquet", block_rows=50)
+    assert pd.read_parquet(out)["s"].iloc[118:122].fillna("-").tolist() == ["-", "-", "v0", "v1"]
+
+    src = tmp_path / "sparse.csv"
+    src.write_text(
+        "a,b\n" + "".join(f"{i},{'' if i < 1000 else f'v{i}'}\n" for i in range(1500)),
+        encoding="utf-8",
+    )
+    ds = ChunkedDataset.from_chunks_dir(
+        split_into_chunks("sparse", str(src), rows_per_chunk=500)["output_dir"]
+    )
+    out = export_dataframe(ds, tmp_path / "chunked.parquet", "parquet")
+    assert pd.read_parquet(out)["b"].count() == 500
+
+
+def test_xlsx_export_splits_over_row_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(data_handler, "XLSX_MAX_ROWS", 41)
+    df = pd.DataFrame({"n": range(100), "s": [f"r{i}" for i in range(100)]})
+    df.loc[3, "s"] = None
+
+    progress = []
+    out = export_dataframe(
+        df, tmp_path / "big.xlsx", "xlsx", lambda p, m: progress.append(p), block_rows=30
+    )
+    sheets = pd.read_excel(out, sheet_name=None)
+    assert list(sheets) == ["Sheet1", "Sheet2", "Sheet3"]
+    assert [len(s) for s in sheets.values()] == [40, 40, 20]
+    assert pd.concat(sheets.values(), ignore_index=True).equals(df)
+    assert progress[-1] == 100 and len(progress) == 5
+
+    export_dataframe(df, tmp_path / "parts.xlsx", "xlsx", xlsx_split="files")
+    parts = ["parts.xlsx", "parts_2.xlsx", "parts_3.xlsx"]
+    assert [len(pd.read_excel(tmp_path / p)) for p in parts] == [40, 40, 20]
+
+    src = tmp_path / "conv.csv"
+    df.to_csv(src, index=False)
+    progress = []
+    out = convert_file(
+        str(src), str(tmp_path / "conv"), "xlsx", lambda p, m: progress.append(p)
+    )
+    assert len(pd.read_excel(out, sheet_name=None)) == 3
+    assert progress == sorted(progress) and progress[-1] == 100